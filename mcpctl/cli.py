@@ -964,19 +964,19 @@ def workspace_create(
 def workspace_list():
     """List all available workspaces"""
     manager = WorkspaceManager()
-    workspaces = manager.list_workspaces()
+    index = manager.workspace_index()
     active = manager.get_active_workspace()
 
-    if not workspaces:
+    if not index:
         typer.echo("No workspaces found. Create one with 'mcpctl workspace create'")
         return
 
     typer.echo("Available workspaces:")
-    for ws in workspaces:
+    for ws in sorted(index):
         marker = "→" if ws == active else " "
-        workspace = manager.load_workspace(ws)
-        if workspace:
-            typer.echo(f"{marker} {ws}: {workspace.description}")
+        entry = index[ws]
+        if entry:
+            typer.echo(f"{marker} {ws}: {entry['description']}")
         else:
             typer.echo(f"{marker} {ws}: (error loading)")
 
@@ -3,7 +3,7 @@ Docker Compose generation from service definitions and templates
 """
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
@@ -57,15 +57,31 @@ class ComposeGenerator:
 
         return services
 
-    def resolve_secrets(self, data: Any) -> Any:
+    def collect_secret_names(self, data: Any, names: Set[str]) -> Set[str]:
+        """Recursively collect secret placeholder names in data structure"""
+        if isinstance(data, dict):
+            for value in data.values():
+                self.collect_secret_names(value, names)
+        elif isinstance(data, list):
+            for item in data:
+                self.collect_secret_names(item, names)
+        elif isinstance(data, str) and data.startswith("${SECRET:"):
+            names.add(data[9:-1])
+        return names
+
+    def resolve_secrets(
+        self, data: Any, values: Optional[Dict[str, str]] = None
+    ) -> Any:
         """Recursively resolve secret placeholders in data structure"""
         if isinstance(data, dict):
-            return {k: self.resolve_secrets(v) for k, v in data.items()}
+            return {k: self.resolve_secrets(v, values) for k, v in data.items()}
         elif isinstance(data, list):
-            return [self.resolve_secrets(item) for item in data]
+            return [self.resolve_secrets(item, values) for item in data]
         elif isinstance(data, str) and data.startswith("${SECRET:"):
             # Extract secret name from ${SECRET:secret_name}
             secret_name = data[9:-1]  # Remove ${SECRET: and }
+            if values is not None and secret_name in values:
+                return values[secret_name]
             return self.secret_backend.get_secret(secret_name)
         else:
             return data
@@ -79,12 +95,18 @@ class ComposeGenerator:
         if "services" not in result:
             result["services"] = {}
 
-        for service_def in services:
-            if "services" in service_def:
-                for service_name, service_config in service_def["services"].items():
-                    # Resolve any secrets in the service config
-                    resolved_config = self.resolve_secrets(service_config)
-                    result["services"][service_name] = resolved_config
+        # Fetch every referenced secret up front so backends can batch lookups
+        service_defs = [s["services"] for s in services if "services" in s]
+        names: Set[str] = set()
+        for service_configs in service_defs:
+            self.collect_secret_names(service_configs, names)
+        values = self.secret_backend.get_secrets(sorted(names)) if names else {}
+
+        for service_configs in service_defs:
+            for service_name, service_config in service_configs.items():
+                # Resolve any secrets in the service config
+                resolved_config = self.resolve_secrets(service_config, values)
+                result["services"][service_name] = resolved_config
 
         return result
 
@@ -5,9 +5,32 @@ Handles first-time vs subsequent installations and user onboarding
 
 import json
 import os
-from datetime import datetime
+import subprocess
+import sys
+import time
+from collections import namedtuple
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# PyYAML is only needed to read docker-compose.yml for status reporting
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Service endpoint exposed by a compose port mapping
+UrlInfo = namedtuple("UrlInfo", "service url port")
+
+
+def _now_iso() -> str:
+    """Current local time in the format stored in installation state"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of output with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 class InstallationState:
@@ -22,45 +45,66 @@ class InstallationState:
         """Check if this is the first time MCP Hub is being installed"""
         return not self.state_file.exists()
 
-    def get_installation_state(self) -> Dict[str, Any]:
-        """Get current installation state"""
-        if not self.state_file.exists():
-            return {
-                "first_installed": None,
-                "last_updated": None,
-                "version": None,
-                "services_configured": False,
-                "wizard_completed": False,
-                "auto_start_enabled": False,
-                "installation_count": 0,
-            }
-
-        try:
-            with open(self.state_file, "r") as f:
-                return json.load(f)
-        except Exception:
-            return self.get_installation_state()  # Return default on error
+    def get_installation_state(self, exists: Optional[bool] = None) -> Dict[str, Any]:
+        """Get current installation state
+
+        Callers that already checked for the state file can pass ``exists``
+        to skip a second stat of it.
+        """
+        if exists is None:
+            exists = self.state_file.exists()
+
+        if exists:
+            try:
+                with open(self.state_file, "r") as f:
+                    return json.load(f)
+            except Exception:
+                pass  # Return default on error
+
+        return {
+            "first_installed": None,
+            "last_updated": None,
+            "version": None,
+            "services_configured": False,
+            "wizard_completed": False,
+            "auto_start_enabled": False,
+            "installation_count": 0,
+        }
+
+    def update_installation_state(
+        self, now_iso: Optional[str] = None, **updates
+    ) -> None:
+        """Update installation state
+
+        ``now_iso`` lets callers that make several updates in one flow share
+        a single timestamp instead of formatting the current time each time.
+        """
+        if now_iso is None:
+            now_iso = _now_iso()
 
-    def update_installation_state(self, **updates) -> None:
-        """Update installation state"""
         state = self.get_installation_state()
         state.update(updates)
-        state["last_updated"] = datetime.now().isoformat()
+        state["last_updated"] = now_iso
         state["installation_count"] = state.get("installation_count", 0) + 1
 
         if state.get("first_installed") is None:
             state["first_installed"] = state["last_updated"]
 
-        with open(self.state_file, "w") as f:
+        # Write to a temp file and rename so a crash never leaves partial JSON
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
 
-    def mark_wizard_completed(self) -> None:
+    def mark_wizard_completed(self, now_iso: Optional[str] = None) -> None:
         """Mark the setup wizard as completed"""
-        self.update_installation_state(wizard_completed=True)
+        self.update_installation_state(now_iso=now_iso, wizard_completed=True)
 
-    def mark_services_configured(self) -> None:
+    def mark_services_configured(self, now_iso: Optional[str] = None) -> None:
         """Mark that user has configured services"""
-        self.update_installation_state(services_configured=True)
+        self.update_installation_state(now_iso=now_iso, services_configured=True)
 
     def get_server_status(self) -> Dict[str, Any]:
         """Get current server status and URLs"""
@@ -76,7 +120,10 @@ class InstallationState:
             # Check for running services
             compose_file = Path("docker-compose.yml")
             if compose_file.exists():
-                import yaml
+                if yaml is None:
+                    raise ImportError(
+                        "PyYAML not found. Install with: pip install pyyaml"
+                    )
 
                 with open(compose_file, "r") as f:
                     compose_data = yaml.safe_load(f)
@@ -85,19 +132,17 @@ class InstallationState:
                 for service_name, service_config in services.items():
                     ports = service_config.get("ports", [])
                     for port_mapping in ports:
-                        if isinstance(port_mapping, str) and ":" in port_mapping:
-                            host_port = port_mapping.split(":")[0]
+                        if type(port_mapping) is not str:
+                            continue
+                        host_port, sep, _ = port_mapping.partition(":")
+                        if sep:
                             url = f"http://localhost:{host_port}"
-                            status["urls"].append(
-                                {"service": service_name, "url": url, "port": host_port}
-                            )
+                            status["urls"].append(UrlInfo(service_name, url, host_port))
 
                 status["services"] = list(services.keys())
 
                 # Check if services are actually running
                 try:
-                    import subprocess
-
                     result = subprocess.run(
                         [
                             "docker",
@@ -135,32 +180,38 @@ class OnboardingManager:
 
     def show_first_time_welcome(self) -> None:
         """Show welcome message for first-time users"""
-        print("🎉 Welcome to MCP Hub!")
-        print("======================")
-        print()
-        print(
-            "MCP Hub helps you manage Model Context Protocol servers using Docker containers."
+        write_lines(
+            [
+                "🎉 Welcome to MCP Hub!",
+                "======================",
+                "",
+                "MCP Hub helps you manage Model Context Protocol servers using Docker containers.",
+                "Let's get you set up with your first MCP configuration!",
+                "",
+            ]
         )
-        print("Let's get you set up with your first MCP configuration!")
-        print()
 
     def show_returning_user_message(self, state: Dict[str, Any]) -> None:
         """Show message for returning users"""
         install_count = state.get("installation_count", 0)
         last_updated = state.get("last_updated", "unknown")
 
-        print("🔄 MCP Hub Update")
-        print("=================")
-        print(f"Installation #{install_count} • Last updated: {last_updated[:10]}")
-        print()
+        lines = [
+            "🔄 MCP Hub Update",
+            "=================",
+            f"Installation #{install_count} • Last updated: {last_updated[:10]}",
+            "",
+        ]
 
         if state.get("services_configured"):
-            print("✅ Your existing services and configurations are preserved")
+            lines.append("✅ Your existing services and configurations are preserved")
         else:
-            print("💡 Continue where you left off with the setup wizard")
-        print()
+            lines.append("💡 Continue where you left off with the setup wizard")
+        lines.append("")
+
+        write_lines(lines)
 
-    def run_quick_setup(self) -> bool:
+    def run_quick_setup(self, now_iso: Optional[str] = None) -> bool:
         """Run quick setup for new users"""
         print("🚀 Quick Setup")
         print("==============")
@@ -211,8 +262,10 @@ class OnboardingManager:
             print("✅ Docker compose configuration generated")
 
             # Mark setup as completed
-            self.installation_state.mark_wizard_completed()
-            self.installation_state.mark_services_configured()
+            if now_iso is None:
+                now_iso = _now_iso()
+            self.installation_state.mark_wizard_completed(now_iso)
+            self.installation_state.mark_services_configured(now_iso)
 
             return True
 
@@ -225,78 +278,88 @@ class OnboardingManager:
         """Show available service URLs"""
         status = self.installation_state.get_server_status()
 
-        print("🌐 MCP Server Status")
-        print("===================")
+        lines = ["🌐 MCP Server Status", "==================="]
 
         if not status["services"]:
-            print("❌ No services configured")
-            print("💡 Run 'mcpctl setup --wizard' to configure services")
+            lines.append("❌ No services configured")
+            lines.append("💡 Run 'mcpctl setup --wizard' to configure services")
+            write_lines(lines)
             return
 
         if not status["running"]:
-            print("⏸️  Services are configured but not running")
-            print("🚀 Start services with: mcpctl start")
-            print()
+            lines.append("⏸️  Services are configured but not running")
+            lines.append("🚀 Start services with: mcpctl start")
+            lines.append("")
 
-        print("📋 Configured Services:")
+        lines.append("📋 Configured Services:")
         for service in status["services"]:
-            print(f"  • {service}")
+            lines.append(f"  • {service}")
 
         if status["urls"]:
-            print()
-            print("🔗 Connection URLs:")
+            lines.append("")
+            lines.append("🔗 Connection URLs:")
+            running_indicator = "🟢" if status["running"] else "🔴"
             for url_info in status["urls"]:
-                running_indicator = "🟢" if status["running"] else "🔴"
-                print(f"  {running_indicator} {url_info['service']}: {url_info['url']}")
+                lines.append(
+                    f"  {running_indicator} {url_info.service}: {url_info.url}"
+                )
 
-        print()
+        lines.append("")
         if status["running"]:
-            print("✅ Services are running and ready to use!")
-            print("💡 Connect your LLM client to the URLs above")
+            lines.append("✅ Services are running and ready to use!")
+            lines.append("💡 Connect your LLM client to the URLs above")
         else:
-            print("🚀 Start services: mcpctl start")
-            print("📊 Check status: mcpctl status")
+            lines.append("🚀 Start services: mcpctl start")
+            lines.append("📊 Check status: mcpctl status")
 
-        print()
+        lines.append("")
+        write_lines(lines)
 
     def show_next_steps(self, is_first_time: bool) -> None:
         """Show appropriate next steps based on user state"""
         if is_first_time:
-            print("🎯 Next Steps:")
-            print("1. 🔧 Configure services: mcpctl setup --wizard")
-            print("2. 🚀 Start services: mcpctl start")
-            print("3. 🔗 Connect your LLM to the provided URLs")
-            print()
-            print("📚 Learn more:")
-            print("• Documentation: https://github.com/saxyguy81/mcp-hub")
-            print("• Examples: mcpctl workspace list")
-            print("• Help: mcpctl --help")
+            lines = [
+                "🎯 Next Steps:",
+                "1. 🔧 Configure services: mcpctl setup --wizard",
+                "2. 🚀 Start services: mcpctl start",
+                "3. 🔗 Connect your LLM to the provided URLs",
+                "",
+                "📚 Learn more:",
+                "• Documentation: https://github.com/saxyguy81/mcp-hub",
+                "• Examples: mcpctl workspace list",
+                "• Help: mcpctl --help",
+            ]
         else:
-            print("🔄 Commands:")
-            print("• 📊 Check status: mcpctl status")
-            print("• 🚀 Start services: mcpctl start")
-            print("• ⏹️  Stop services: mcpctl stop")
-            print("• 🔧 Reconfigure: mcpctl setup --wizard")
+            lines = [
+                "🔄 Commands:",
+                "• 📊 Check status: mcpctl status",
+                "• 🚀 Start services: mcpctl start",
+                "• ⏹️  Stop services: mcpctl stop",
+                "• 🔧 Reconfigure: mcpctl setup --wizard",
+            ]
 
-        print()
+        lines.append("")
+        write_lines(lines)
 
 
 def handle_installation_flow(version: str = "1.0.0") -> None:
     """Handle the complete installation flow"""
     onboarding = OnboardingManager()
     installation_state = onboarding.installation_state
+    now_iso = _now_iso()
 
     is_first_time = installation_state.is_first_installation()
-    state = installation_state.get_installation_state()
+    state = installation_state.get_installation_state(exists=not is_first_time)
 
     if is_first_time:
         onboarding.show_first_time_welcome()
 
         # Run quick setup
-        setup_completed = onboarding.run_quick_setup()
+        setup_completed = onboarding.run_quick_setup(now_iso)
 
         # Update installation state
         installation_state.update_installation_state(
+            now_iso=now_iso,
             version=version,
             wizard_completed=setup_completed,
             services_configured=setup_completed,
@@ -312,7 +375,7 @@ def handle_installation_flow(version: str = "1.0.0") -> None:
         onboarding.show_returning_user_message(state)
 
         # Update version
-        installation_state.update_installation_state(version=version)
+        installation_state.update_installation_state(now_iso=now_iso, version=version)
 
         # Show current status
         onboarding.show_service_urls()
@@ -330,6 +393,6 @@ def get_connection_info() -> Dict[str, Any]:
         "status": "running" if status["running"] else "stopped",
         "services": status["services"],
         "urls": status["urls"],
-        "mcp_endpoints": [url["url"] for url in status["urls"]],
-        "primary_url": status["urls"][0]["url"] if status["urls"] else None,
+        "mcp_endpoints": [url_info.url for url_info in status["urls"]],
+        "primary_url": status["urls"][0].url if status["urls"] else None,
     }
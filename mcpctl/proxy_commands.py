@@ -4,15 +4,25 @@ Enhanced MCP Proxy CLI Commands
 
 import json
 import os
+import select
 import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
-import requests
 import typer
+import urllib3
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError, ProtocolError
+
+from .onboarding import get_connection_info
+
+# Use orjson for parsing proxy responses when available
+try:
+    import orjson as fast_json
+except ImportError:
+    fast_json = json
 
 # Import from existing CLI
 try:
@@ -34,6 +44,13 @@ main_app.add_typer(proxy_app, name="proxy")
 PROXY_PID_FILE = Path.home() / ".mcpctl" / "proxy.pid"
 PROXY_LOG_FILE = Path.home() / ".mcpctl" / "proxy.log"
 
+# Keep-alive connection pool reused for every request to the local proxy
+_PROXY_HTTP = urllib3.PoolManager(num_pools=1, maxsize=2, retries=False)
+
+# Short-lived cache of parsed proxy responses: path -> (fetched_at, status, data)
+PROXY_CACHE_TTL = 2.0
+_PROXY_CACHE: Dict[str, Tuple[float, int, Any]] = {}
+
 
 def ensure_config_dir():
     """Ensure config directory exists"""
@@ -44,22 +61,44 @@ def ensure_config_dir():
 
 def get_proxy_pid() -> Optional[int]:
     """Get running proxy PID if any"""
-    if PROXY_PID_FILE.exists():
-        try:
-            with open(PROXY_PID_FILE, "r") as f:
-                pid = int(f.read().strip())
+    try:
+        with open(PROXY_PID_FILE, "r") as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        # Missing or unreadable PID file
+        return None
 
-            # Check if process is still running
+    # Check if process is still running
+    try:
+        os.kill(pid, 0)  # Doesn't actually kill, just checks
+        return pid
+    except OSError:
+        # Process not running, clean up pid file
+        PROXY_PID_FILE.unlink(missing_ok=True)
+        return None
+
+
+def find_proxy_pids() -> List[int]:
+    """Find running proxy processes by scanning /proc (Linux only)"""
+    pids = []
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return pids
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == os.getpid():
+                continue
             try:
-                os.kill(pid, 0)  # Doesn't actually kill, just checks
-                return pid
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    args = f.read().split(b"\0")
             except OSError:
-                # Process not running, clean up pid file
-                PROXY_PID_FILE.unlink()
-                return None
-        except:
-            return None
-    return None
+                continue  # Process exited or is not ours to inspect
+            # Proxies are started as "<python> .../mcp_proxy.py --port ..."
+            if len(args) > 1 and args[1].endswith(b"mcp_proxy.py"):
+                pids.append(int(entry.name))
+    return pids
 
 
 def save_proxy_pid(pid: int):
@@ -69,16 +108,111 @@ def save_proxy_pid(pid: int):
         f.write(str(pid))
 
 
-def check_proxy_status() -> dict:
-    """Check if proxy is running and healthy"""
+def wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit, returning False if it outlives the timeout"""
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # Kernel without pidfd support, fall back to polling
+            pidfd = None
+
+        if pidfd is not None:
+            try:
+                # A pidfd becomes readable once the process terminates
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(pidfd)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)  # Check if still running
+        except OSError:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def _tail(
+    f: BinaryIO, count: int, block_size: int = 64 * 1024
+) -> Tuple[List[str], int]:
+    """Last lines of an open binary file and the end offset they were read up to"""
+    end = position = f.seek(0, os.SEEK_END)
+    if count <= 0:
+        return [], end
+
+    data = b""
+    while position > 0 and data.count(b"\n") <= count:
+        step = min(block_size, position)
+        position -= step
+        f.seek(position)
+        data = f.read(step) + data
+
+    return data.decode(errors="replace").splitlines()[-count:], end
+
+
+def read_last_lines(path: Path, count: int, block_size: int = 64 * 1024) -> List[str]:
+    """Read the last lines of a file by seeking backwards from the end"""
+    with open(path, "rb") as f:
+        return _tail(f, count, block_size)[0]
+
+
+def proxy_request(path: str, timeout: float = 5):
+    """GET an endpoint of the local proxy over the shared connection pool"""
+    return _PROXY_HTTP.request("GET", f"http://localhost:3000{path}", timeout=timeout)
+
+
+def fetch_proxy_json(path: str, timeout: float = 5) -> Tuple[int, Any]:
+    """GET and parse a proxy endpoint, reusing responses younger than the TTL"""
+    now = time.monotonic()
+    cached = _PROXY_CACHE.get(path)
+    if cached and now - cached[0] < PROXY_CACHE_TTL:
+        return cached[1], cached[2]
+
+    response = proxy_request(path, timeout=timeout)
+    data = fast_json.loads(response.data) if response.status == 200 else None
+    _PROXY_CACHE[path] = (now, response.status, data)
+    return response.status, data
+
+
+def check_proxy_status(detailed: bool = False) -> dict:
+    """Check if proxy is running and healthy
+
+    With ``detailed`` the ``/status`` endpoint is queried instead of
+    ``/health`` and its full payload is returned under ``details``, so
+    callers that need both get them from a single request. Detailed
+    lookups are served from a short TTL cache.
+    """
     try:
-        response = requests.get("http://localhost:3000/health", timeout=3)
+        if not detailed:
+            response = proxy_request("/health", timeout=3)
+            return {
+                "running": True,
+                "healthy": response.status == 200,
+                "data": (
+                    fast_json.loads(response.data) if response.status == 200 else None
+                ),
+            }
+
+        status_code, details = fetch_proxy_json("/status")
         return {
             "running": True,
-            "healthy": response.status_code == 200,
-            "data": response.json() if response.status_code == 200 else None,
+            "healthy": status_code == 200,
+            "data": (
+                {
+                    "servers": details.get("total_servers", 0),
+                    "healthy_servers": details.get("healthy_servers", 0),
+                }
+                if details is not None
+                else None
+            ),
+            "details": details,
         }
-    except requests.exceptions.ConnectionError:
+    except (NewConnectionError, ConnectTimeoutError, ProtocolError):
         return {"running": False, "healthy": False, "data": None}
     except Exception as e:
         return {"running": False, "healthy": False, "error": str(e)}
@@ -114,28 +248,17 @@ def start_proxy(
         typer.echo("💡 Run 'mcpctl setup --wizard' first to create services", err=True)
         raise typer.Exit(1)
 
-    # Check if services are running
+    # Make sure services are running. "up" is idempotent, leaves running
+    # containers alone and --wait only blocks until started ones are ready
     if auto_start_services:
         try:
-            result = subprocess.run(
-                ["docker", "compose", "ps", "--services", "--filter", "status=running"],
-                cwd=".",
-                capture_output=True,
-                text=True,
+            typer.echo("⚡ Ensuring MCP services are running...")
+            subprocess.run(
+                ["docker", "compose", "up", "-d", "--no-recreate", "--wait"],
                 check=True,
+                cwd=".",
             )
-
-            running_services = (
-                result.stdout.strip().split("\n") if result.stdout.strip() else []
-            )
-            if not running_services:
-                typer.echo("⚡ No MCP services running. Starting services first...")
-                subprocess.run(["docker", "compose", "up", "-d"], check=True, cwd=".")
-                typer.echo("✅ Services started")
-
-                # Wait for services to be ready
-                typer.echo("⏳ Waiting for services to be ready...")
-                time.sleep(5)
+            typer.echo("✅ Services ready")
 
         except subprocess.CalledProcessError as e:
             typer.echo(f"❌ Failed to check/start services: {e}", err=True)
@@ -205,7 +328,16 @@ def start_proxy(
             # Run in foreground
             typer.echo("🚀 Starting MCP Hub proxy (foreground mode)...")
             typer.echo("   Press Ctrl+C to stop")
-            subprocess.run(cmd)
+            process = subprocess.Popen(cmd)
+
+            # Record the PID so stop/status work from another shell
+            save_proxy_pid(process.pid)
+            try:
+                process.wait()
+            finally:
+                if process.poll() is None:
+                    process.wait()  # Let the proxy finish handling Ctrl+C
+                PROXY_PID_FILE.unlink(missing_ok=True)
 
     except KeyboardInterrupt:
         typer.echo("\n🛑 Proxy stopped by user")
@@ -220,6 +352,7 @@ def stop_proxy():
 
     # Check if proxy is running
     pid = get_proxy_pid()
+    pids = [pid] if pid else []
     if not pid:
         status = check_proxy_status()
         if not status["running"]:
@@ -227,26 +360,25 @@ def stop_proxy():
             return
         else:
             typer.echo(
-                "⚠️  Proxy running but PID file missing. Trying to stop via HTTP..."
+                "⚠️  Proxy running but PID file missing. Looking for proxy processes..."
             )
+            pids = find_proxy_pids()
 
     try:
-        if pid:
-            # Try graceful shutdown first
-            os.kill(pid, signal.SIGTERM)
-
-            # Wait for graceful shutdown
-            for i in range(10):
-                try:
-                    os.kill(pid, 0)  # Check if still running
-                    time.sleep(0.5)
-                except OSError:
-                    # Process has stopped
-                    break
-            else:
-                # Force kill if graceful shutdown failed
-                typer.echo("⚡ Force stopping proxy...")
-                os.kill(pid, signal.SIGKILL)
+        for pid in pids:
+            # A process that exits on its own must not stop the others
+            try:
+                # Try graceful shutdown first
+                os.kill(pid, signal.SIGTERM)
+                _PROXY_CACHE.clear()
+
+                # Wait for graceful shutdown, force kill if it takes too long
+                if not wait_for_exit(pid, timeout=5.0):
+                    typer.echo("⚡ Force stopping proxy...")
+                    os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                typer.echo(f"ℹ️  Proxy process already stopped (PID: {pid})")
+                continue
 
             typer.echo(f"✅ Stopped proxy server (PID: {pid})")
 
@@ -260,9 +392,6 @@ def stop_proxy():
         else:
             typer.echo("⚠️  Proxy may still be running on different PID")
 
-    except ProcessLookupError:
-        typer.echo("ℹ️  Proxy process already stopped")
-        PROXY_PID_FILE.unlink(missing_ok=True)
     except PermissionError:
         typer.echo("❌ Permission denied stopping proxy", err=True)
         typer.echo("💡 Try running with sudo or check process ownership", err=True)
@@ -274,62 +403,58 @@ def stop_proxy():
 def proxy_status():
     """📊 Show proxy server status and connected services"""
 
+    lines: List[str] = []
+
     # Check if proxy process is running
     pid = get_proxy_pid()
-    status = check_proxy_status()
+    status = check_proxy_status(detailed=True)
 
     if not status["running"]:
-        typer.echo("🔴 MCP Hub Proxy: NOT RUNNING")
+        lines.append("🔴 MCP Hub Proxy: NOT RUNNING")
         if pid:
-            typer.echo(f"⚠️  Stale PID file found (PID: {pid})")
-        typer.echo("\n💡 Start with: mcpctl proxy start")
+            lines.append(f"⚠️  Stale PID file found (PID: {pid})")
+        lines.append("\n💡 Start with: mcpctl proxy start")
+        typer.echo("\n".join(lines))
         return
 
-    typer.echo("🟢 MCP Hub Proxy: RUNNING")
+    lines.append("🟢 MCP Hub Proxy: RUNNING")
     if pid:
-        typer.echo(f"📍 PID: {pid}")
-    typer.echo(f"📍 Endpoint: http://localhost:3000")
+        lines.append(f"📍 PID: {pid}")
+    lines.append(f"📍 Endpoint: http://localhost:3000")
 
     if status["healthy"] and status["data"]:
         data = status["data"]
-        typer.echo(
+        lines.append(
             f"📊 Backend Servers: {data.get('healthy_servers', 0)}/{data.get('servers', 0)} healthy"
         )
 
-        # Get detailed status
-        try:
-            response = requests.get("http://localhost:3000/status", timeout=5)
-            if response.status_code == 200:
-                detailed_status = response.json()
-
-                typer.echo("\n🔗 Backend Services:")
-                for name, info in detailed_status.get("servers", {}).items():
-                    status_icon = "🟢" if info["healthy"] else "🔴"
-                    error_info = (
-                        f" (errors: {info['error_count']})"
-                        if info["error_count"] > 0
-                        else ""
-                    )
-                    typer.echo(f"  {status_icon} {name}: {info['url']}{error_info}")
+        # Show detailed status from the same /status response
+        detailed_status = status["details"]
 
-                # Show mapping info
-                tool_count = detailed_status.get("tool_mappings", 0)
-                resource_count = detailed_status.get("resource_mappings", 0)
-                typer.echo(
-                    f"\n📋 Cached Mappings: {tool_count} tools, {resource_count} resources"
-                )
+        lines.append("\n🔗 Backend Services:")
+        for name, info in detailed_status.get("servers", {}).items():
+            status_icon = "🟢" if info["healthy"] else "🔴"
+            error_info = (
+                f" (errors: {info['error_count']})" if info["error_count"] > 0 else ""
+            )
+            lines.append(f"  {status_icon} {name}: {info['url']}{error_info}")
 
-        except Exception as e:
-            typer.echo(f"\n⚠️  Could not get detailed status: {e}")
+        # Show mapping info
+        tool_count = detailed_status.get("tool_mappings", 0)
+        resource_count = detailed_status.get("resource_mappings", 0)
+        lines.append(
+            f"\n📋 Cached Mappings: {tool_count} tools, {resource_count} resources"
+        )
 
     else:
-        typer.echo("🔴 Proxy unhealthy or unreachable")
+        lines.append("🔴 Proxy unhealthy or unreachable")
 
-    typer.echo("\n📋 LLM Client Configuration:")
-    typer.echo("   Configure your LLM client with this single endpoint:")
-    typer.echo("   🎯 http://localhost:3000")
-    typer.echo("\n💡 View logs: mcpctl proxy logs")
-    typer.echo("💡 List servers: mcpctl proxy servers")
+    lines.append("\n📋 LLM Client Configuration:")
+    lines.append("   Configure your LLM client with this single endpoint:")
+    lines.append("   🎯 http://localhost:3000")
+    lines.append("\n💡 View logs: mcpctl proxy logs")
+    lines.append("💡 List servers: mcpctl proxy servers")
+    typer.echo("\n".join(lines))
 
 
 @proxy_app.command("logs")
@@ -350,21 +475,24 @@ def proxy_logs(
             typer.echo(f"📜 Following proxy logs from {PROXY_LOG_FILE}")
             typer.echo("   Press Ctrl+C to stop\n")
 
-            subprocess.run(["tail", "-f", "-n", str(lines), str(PROXY_LOG_FILE)])
+            # One handle for tail and follow, so lines written in between
+            # are not skipped
+            with open(PROXY_LOG_FILE, "rb") as f:
+                tail, end = _tail(f, lines)
+                for line in tail:
+                    typer.echo(line)
+
+                f.seek(end)
+                while True:
+                    line = f.readline()
+                    if line:
+                        typer.echo(line.decode(errors="replace"), nl=False)
+                    else:
+                        time.sleep(0.1)
         else:
             # Show last N lines
             typer.echo(f"📜 Last {lines} lines from {PROXY_LOG_FILE}:\n")
-
-            result = subprocess.run(
-                ["tail", "-n", str(lines), str(PROXY_LOG_FILE)],
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode == 0:
-                typer.echo(result.stdout)
-            else:
-                typer.echo("❌ Failed to read logs")
+            typer.echo("\n".join(read_last_lines(PROXY_LOG_FILE, lines)))
 
     except KeyboardInterrupt:
         typer.echo("\n📜 Stopped following logs")
@@ -383,12 +511,12 @@ def list_servers():
         return
 
     try:
-        response = requests.get("http://localhost:3000/servers", timeout=5)
-        if response.status_code != 200:
+        response = proxy_request("/servers")
+        if response.status != 200:
             typer.echo("❌ Failed to get server list")
             return
 
-        data = response.json()
+        data = fast_json.loads(response.data)
         servers = data.get("servers", [])
 
         if not servers:
@@ -444,51 +572,50 @@ def restart_proxy():
 def show_connection_info():
     """🔗 Show connection information for LLM clients"""
 
-    # Check if proxy is running
-    proxy_status = check_proxy_status()
+    lines: List[str] = []
+
+    # Check if proxy is running, /status answering 200 means it is healthy
+    proxy_status = check_proxy_status(detailed=True)
 
     if proxy_status["running"] and proxy_status["healthy"]:
-        typer.echo("🎯 SINGLE ENDPOINT MODE (Recommended)")
-        typer.echo("=" * 40)
-        typer.echo("✨ Your MCP Hub proxy is running!")
-        typer.echo()
-        typer.echo("🔗 Configure your LLM client with:")
-        typer.echo("   📍 http://localhost:3000")
-        typer.echo()
-        typer.echo("✅ This single endpoint provides access to all your MCP servers")
+        lines.append("🎯 SINGLE ENDPOINT MODE (Recommended)")
+        lines.append("=" * 40)
+        lines.append("✨ Your MCP Hub proxy is running!")
+        lines.append("")
+        lines.append("🔗 Configure your LLM client with:")
+        lines.append("   📍 http://localhost:3000")
+        lines.append("")
+        lines.append("✅ This single endpoint provides access to all your MCP servers")
 
         # Show backend status
         if proxy_status["data"]:
             backend_count = proxy_status["data"].get("servers", 0)
             healthy_count = proxy_status["data"].get("healthy_servers", 0)
-            typer.echo(f"📊 Backend: {healthy_count}/{backend_count} servers healthy")
+            lines.append(f"📊 Backend: {healthy_count}/{backend_count} servers healthy")
 
-        typer.echo("\n💡 Management commands:")
-        typer.echo("   📊 mcpctl proxy status   - Check proxy health")
-        typer.echo("   🔗 mcpctl proxy servers  - List backend servers")
-        typer.echo("   📜 mcpctl proxy logs     - View proxy logs")
+        lines.append("\n💡 Management commands:")
+        lines.append("   📊 mcpctl proxy status   - Check proxy health")
+        lines.append("   🔗 mcpctl proxy servers  - List backend servers")
+        lines.append("   📜 mcpctl proxy logs     - View proxy logs")
 
     else:
-        typer.echo("🔗 MULTI-ENDPOINT MODE")
-        typer.echo("=" * 25)
-        typer.echo("⚠️  Proxy not running - using individual server endpoints")
-        typer.echo()
-        typer.echo("💡 For easier setup, start the proxy:")
-        typer.echo("   🚀 mcpctl proxy start")
-        typer.echo()
+        lines.append("🔗 MULTI-ENDPOINT MODE")
+        lines.append("=" * 25)
+        lines.append("⚠️  Proxy not running - using individual server endpoints")
+        lines.append("")
+        lines.append("💡 For easier setup, start the proxy:")
+        lines.append("   🚀 mcpctl proxy start")
+        lines.append("")
 
         # Show individual endpoints (fallback mode)
-        try:
-            from .onboarding import get_connection_info
+        connection_info = get_connection_info()
 
-            connection_info = get_connection_info()
+        if connection_info.get("mcp_endpoints"):
+            lines.append("🔗 Individual endpoints (current configuration):")
+            for url in connection_info["mcp_endpoints"]:
+                lines.append(f"   📍 {url}")
+        else:
+            lines.append("❌ No services running")
+            lines.append("🚀 Start with: mcpctl start")
 
-            if connection_info.get("mcp_endpoints"):
-                typer.echo("🔗 Individual endpoints (current configuration):")
-                for url in connection_info["mcp_endpoints"]:
-                    typer.echo(f"   📍 {url}")
-            else:
-                typer.echo("❌ No services running")
-                typer.echo("🚀 Start with: mcpctl start")
-        except ImportError:
-            typer.echo("📍 Check individual service ports with: mcpctl status")
+    typer.echo("\n".join(lines))
@@ -2,8 +2,14 @@
 Registry management for MCP Hub with CLI fallback
 """
 
+import gzip
+import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -18,23 +24,55 @@ except ImportError:
     DOCKER_API_AVAILABLE = False
     docker = None
 
+# Paths used by every build/save, relative to the repository root
+_WEB_DOCKERFILE = Path("web/Dockerfile")
+_TARBALL = Path("mcp-hub-images.tar")
+_TARBALL_GZ = Path("mcp-hub-images.tar.gz")
+
+# Label stamped on built images so the daemon can filter them server-side
+MCP_IMAGE_LABEL = "org.mcp-hub"
+
+# Copy image streams in large blocks to keep per-write overhead low
+COPY_BUFFER_SIZE = 4 << 20
+
+# Docker API client shared by all RegistryManager instances; the daemon is
+# pinged once and the outcome reused (None means not checked yet)
+_CLIENT_SINGLETON = None
+_CLIENT_LIVE: Optional[bool] = None
+
 
 class RegistryManager:
     """Manages Docker registry operations with CLI fallback"""
 
     def __init__(self, config):
+        global _CLIENT_SINGLETON, _CLIENT_LIVE
+
         self.config = config
         self.client = None
+        self._images_cache: Optional[List] = None
+        self._images_cache_ts = 0.0
 
         # Try to initialize Docker client if available
         if DOCKER_API_AVAILABLE:
-            try:
-                self.client = docker.from_env()
-                # Test connection
-                self.client.ping()
-            except Exception as e:
-                typer.echo(f"⚠️  Docker API not available, using CLI fallback: {e}")
-                self.client = None
+            if _CLIENT_LIVE is None:
+                try:
+                    _CLIENT_SINGLETON = docker.from_env()
+                    # Test connection
+                    _CLIENT_SINGLETON.ping()
+                    _CLIENT_LIVE = True
+                except Exception as e:
+                    typer.echo(f"⚠️  Docker API not available, using CLI fallback: {e}")
+                    _CLIENT_SINGLETON = None
+                    _CLIENT_LIVE = False
+            self.client = _CLIENT_SINGLETON
+
+    def _list_images_cached(self, ttl: float = 5.0) -> List:
+        """List local images, reusing a recent result from this manager"""
+        now = time.monotonic()
+        if self._images_cache is None or now - self._images_cache_ts >= ttl:
+            self._images_cache = self.client.images.list()
+            self._images_cache_ts = now
+        return self._images_cache
 
     def push_images(self, tag: str = "latest") -> None:
         """Build and push all MCP images to registry"""
@@ -53,29 +91,28 @@ class RegistryManager:
 
         # Define the images we expect to build
         image_name = f"{registry}/web"
-        full_tag = f"{image_name}:{tag}"
+        targets = [f"{image_name}:{tag}"]
+
+        # Also push latest tag if this isn't latest
+        if tag != "latest":
+            targets.append(f"{image_name}:latest")
 
-        typer.echo(f"Pushing {full_tag} using Docker CLI")
+        # Keep progress lines from concurrent pushes intact
+        echo_lock = threading.Lock()
 
-        try:
-            # Push the image
-            result = subprocess.run(
-                ["docker", "push", full_tag], capture_output=True, text=True, check=True
+        def push(target: str) -> None:
+            with echo_lock:
+                typer.echo(f"Pushing {target} using Docker CLI")
+            subprocess.run(
+                ["docker", "push", target], capture_output=True, text=True, check=True
             )
+            with echo_lock:
+                typer.echo(f"✅ Pushed {target}")
 
-            typer.echo(f"✅ Pushed {full_tag}")
-
-            # Also push latest tag if this isn't latest
-            if tag != "latest":
-                latest_tag = f"{image_name}:latest"
-                typer.echo(f"Pushing {latest_tag}")
-                subprocess.run(
-                    ["docker", "push", latest_tag],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                typer.echo(f"✅ Pushed {latest_tag}")
+        try:
+            # Tags share layers, so concurrent pushes mostly overlap manifest uploads
+            with ThreadPoolExecutor(max_workers=min(4, len(targets))) as executor:
+                list(executor.map(push, targets))
 
         except subprocess.CalledProcessError as e:
             typer.echo(f"❌ Failed to push images: {e}")
@@ -109,12 +146,38 @@ class RegistryManager:
             f"Saving {len(images_to_save)} MCP images to tarball using Docker CLI"
         )
 
-        tarball_path = Path("mcp-hub-images.tar")
+        tarball_path = _TARBALL_GZ
+
+        # Prefer parallel gzip, docker load reads either format
+        if shutil.which("pigz"):
+            compress_cmd = ["pigz", "-c", "-p", str(os.cpu_count() or 1)]
+        elif shutil.which("gzip"):
+            compress_cmd = ["gzip", "-c"]
+        else:
+            compress_cmd = None
 
         try:
-            # Save images to tarball
-            cmd = ["docker", "save", "-o", str(tarball_path)] + images_to_save
-            subprocess.run(cmd, check=True)
+            # Stream docker save straight into the compressor
+            save_cmd = ["docker", "save"] + images_to_save
+            with open(tarball_path, "wb") as out:
+                save = subprocess.Popen(save_cmd, stdout=subprocess.PIPE)
+                if compress_cmd:
+                    compress = subprocess.Popen(
+                        compress_cmd, stdin=save.stdout, stdout=out
+                    )
+                    save.stdout.close()  # compressor owns the pipe now
+                    compress_code = compress.wait()
+                else:
+                    with gzip.GzipFile(fileobj=out, mode="wb") as gz:
+                        shutil.copyfileobj(save.stdout, gz, COPY_BUFFER_SIZE)
+                    save.stdout.close()
+                    compress_code = 0
+                save_code = save.wait()
+
+            if save_code != 0:
+                raise subprocess.CalledProcessError(save_code, save_cmd)
+            if compress_code != 0:
+                raise subprocess.CalledProcessError(compress_code, compress_cmd)
 
             typer.echo(f"✅ Saved images to {tarball_path}")
             return tarball_path
@@ -134,12 +197,17 @@ class RegistryManager:
             base_registry = "ghcr.io/saxyguy81/mcp-hub"
 
         # Build web service image
-        web_dockerfile = Path("web/Dockerfile")
-        if web_dockerfile.exists():
+        if _WEB_DOCKERFILE.exists():
             image_name = f"{base_registry}/web"
             typer.echo(f"Building web service: {image_name}:{tag}")
 
             try:
+                # Pull the previous image so BuildKit can reuse its cached layers
+                subprocess.run(
+                    ["docker", "pull", f"{image_name}:latest"],
+                    capture_output=True,
+                )
+
                 # Build the image from repository root
                 cmd = [
                     "docker",
@@ -148,10 +216,18 @@ class RegistryManager:
                     "web/Dockerfile",
                     "-t",
                     f"{image_name}:{tag}",
+                    "--cache-from",
+                    f"{image_name}:latest",
+                    "--build-arg",
+                    "BUILDKIT_INLINE_CACHE=1",
+                    "--progress=plain",
+                    "--label",
+                    f"{MCP_IMAGE_LABEL}=true",
                     ".",
                 ]
 
-                subprocess.run(cmd, check=True)
+                env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+                subprocess.run(cmd, check=True, env=env)
 
                 # Also tag as latest if not already latest
                 if tag != "latest":
@@ -167,6 +243,9 @@ class RegistryManager:
 
                 typer.echo(f"✅ Built {image_name}:{tag}")
 
+                # New tags exist now, drop any cached image list
+                self._images_cache = None
+
             except subprocess.CalledProcessError as e:
                 typer.echo(f"❌ Error building web service: {e}")
                 raise
@@ -181,17 +260,19 @@ class RegistryManager:
             images = self._get_mcp_images_api()
             registry = self.config.docker_registry or "ghcr.io"
 
-            for image in images:
-                if image.tags:
-                    for image_tag in image.tags:
-                        if registry in image_tag:
-                            repository, tag_part = (
-                                image_tag.rsplit(":", 1)
-                                if ":" in image_tag
-                                else (image_tag, "latest")
-                            )
-                            self.client.images.push(repository, tag=tag_part)
-                            typer.echo(f"✅ Pushed {image_tag}")
+            # Every registry tag is pushed, an image carries both :tag and :latest
+            push_tags = [
+                image_tag
+                for image in images
+                for image_tag in image.tags or ()
+                if registry in image_tag
+            ]
+            for image_tag in push_tags:
+                repository, sep, tag_part = image_tag.rpartition(":")
+                if not sep:
+                    repository, tag_part = image_tag, "latest"
+                self.client.images.push(repository, tag=tag_part)
+                typer.echo(f"✅ Pushed {image_tag}")
         except Exception as e:
             typer.echo(f"⚠️ API method failed, falling back to CLI: {e}")
             self._push_images_cli(tag)
@@ -200,8 +281,7 @@ class RegistryManager:
         """Build using API - fallback to CLI if needed"""
         try:
             base_registry = self.config.docker_registry or "ghcr.io/saxyguy81/mcp-hub"
-            web_dockerfile = Path("web/Dockerfile")
-            if web_dockerfile.exists():
+            if _WEB_DOCKERFILE.exists():
                 image_name = f"{base_registry}/web"
                 image, logs = self.client.images.build(
                     path=".",
@@ -209,28 +289,37 @@ class RegistryManager:
                     tag=f"{image_name}:{tag}",
                     rm=True,
                     pull=True,
+                    labels={MCP_IMAGE_LABEL: "true"},
                 )
                 if tag != "latest":
                     image.tag(image_name, "latest")
                 typer.echo(f"✅ Built {image_name}:{tag}")
+
+                # New tags exist now, drop any cached image list
+                self._images_cache = None
         except Exception as e:
             typer.echo(f"⚠️ API build failed, falling back to CLI: {e}")
             self._build_images_cli(tag)
 
     def _get_mcp_images_api(self) -> List:
         """Get MCP images using API"""
-        all_images = self.client.images.list()
-        mcp_images = []
+        labeled = self.client.images.list(filters={"label": f"{MCP_IMAGE_LABEL}=true"})
+        if labeled:
+            return labeled
+
+        # Images built before the label existed are matched by tag instead
         registry = self.config.docker_registry or "ghcr.io"
-        for image in all_images:
-            if image.tags:
-                for tag in image.tags:
-                    if ("mcp-hub" in tag.lower() or "mcp" in tag.lower()) or (
-                        registry in tag and ("web" in tag or "mcp" in tag)
-                    ):
-                        mcp_images.append(image)
-                        break
-        return mcp_images
+
+        def is_mcp_tag(tag: str) -> bool:
+            # "mcp" in the lowercased tag already covers "mcp-hub" and "mcp"
+            return "mcp" in tag.lower() or (registry in tag and "web" in tag)
+
+        # One pass over the images, stopping at the first matching tag
+        return [
+            image
+            for image in self._list_images_cached()
+            if image.tags and any(is_mcp_tag(tag) for tag in image.tags)
+        ]
 
     def _save_images_tarball_api(self, tag: str = "latest") -> Path:
         """Save using API - fallback to CLI if needed"""
@@ -238,15 +327,17 @@ class RegistryManager:
             self._build_images_api(tag)
             images = self._get_mcp_images_api()
             if not images:
-                return Path("mcp-hub-images.tar")
+                return _TARBALL
 
             image_names = [img.tags[0] for img in images if img.tags]
-            tarball_path = Path("mcp-hub-images.tar")
+            tarball_path = _TARBALL
             with open(tarball_path, "wb") as f:
                 for image_name in image_names:
-                    image_data = self.client.api.get_image(image_name)
-                    for chunk in image_data:
-                        f.write(chunk)
+                    image_data = self.client.api.get_image(
+                        image_name, chunk_size=COPY_BUFFER_SIZE
+                    )
+                    # writelines drains the chunk generator without a Python loop
+                    f.writelines(image_data)
             return tarball_path
         except Exception as e:
             typer.echo(f"⚠️ API save failed, falling back to CLI: {e}")
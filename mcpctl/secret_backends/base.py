@@ -3,7 +3,7 @@ Abstract base class for secret backends
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class SecretBackend(ABC):
@@ -14,6 +14,10 @@ class SecretBackend(ABC):
         """Retrieve a secret by name"""
         pass
 
+    def get_secrets(self, names: List[str]) -> Dict[str, str]:
+        """Retrieve several secrets by name"""
+        return {name: self.get_secret(name) for name in names}
+
     @abstractmethod
     def set_secret(self, name: str, value: str) -> None:
         """Store a secret"""
@@ -19,13 +19,14 @@ class EnvBackend(SecretBackend):
     def get_secret(self, name: str) -> str:
         """Get secret from environment or prompt user"""
         # First try environment variable
-        env_name = f"MCP_{name.upper()}"
-        if env_name in os.environ:
-            return os.environ[env_name]
+        value = os.environ.get(f"MCP_{name.upper()}")
+        if value is not None:
+            return value
 
         # Try cached secrets
-        if name in self._secrets:
-            return self._secrets[name]
+        value = self._secrets.get(name)
+        if value is not None:
+            return value
 
         # Prompt user for secret
         value = typer.prompt(f"Enter secret '{name}'", hide_input=True)
@@ -38,16 +39,16 @@ class EnvBackend(SecretBackend):
 
     def list_secrets(self) -> Dict[str, str]:
         """List all available secrets"""
-        secrets = {}
-        # Add environment variables
-        for key, value in os.environ.items():
-            if key.startswith("MCP_"):
-                secret_name = key[4:].lower()
-                secrets[secret_name] = value
+        # Values can change without the environment changing size, so scan
+        # it every time; one pass over os.environ is cheap
+        secrets = {
+            key[4:].lower(): value
+            for key, value in os.environ.items()
+            if key[:4] == "MCP_"
+        }
 
         # Add cached secrets
-        secrets.update(self._secrets)
-        return secrets
+        return {**secrets, **self._secrets}
 
     def delete_secret(self, name: str) -> None:
         """Delete secret from cache"""
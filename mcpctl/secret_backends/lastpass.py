@@ -3,26 +3,50 @@ LastPass secret backend using lpass CLI
 """
 
 import json
+import re
+import shutil
 import subprocess
-from typing import Dict
+import time
+from typing import Dict, List, Optional, Tuple
 
 from .base import SecretBackend
 
+# Last path segment of each `lpass ls` line, without the " [id: ...]" suffix
+_LPASS_LS_RE = re.compile(r"^.*/([^/\n]*?)(?: \[.*)?$", re.M)
+
 
 class LastPassBackend(SecretBackend):
     """LastPass secret backend using lpass command line tool"""
 
-    def __init__(self, folder: str = "mcp-hub"):
+    # (timestamp, ok) of the last `lpass status` run, shared by all instances
+    _lpass_status_cache: Optional[Tuple[float, bool]] = None
+    _LPASS_STATUS_TTL = 60.0
+
+    def __init__(self, folder: str = "mcp-hub", cache_ttl: float = 0):
         self.folder = folder
+        # Seconds to keep decrypted values in memory, 0 disables caching
+        self._ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, str]] = {}
         self._check_lpass_available()
 
-    def _check_lpass_available(self):
+    @classmethod
+    def _check_lpass_available(cls):
         """Check if lpass is installed and user is logged in"""
-        try:
-            subprocess.run(
-                ["lpass", "status"], check=True, capture_output=True, text=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        now = time.monotonic()
+        cached = cls._lpass_status_cache
+        if cached is None or now - cached[0] >= cls._LPASS_STATUS_TTL:
+            # shutil.which rejects a missing CLI without spawning anything
+            ok = shutil.which("lpass") is not None
+            if ok:
+                try:
+                    subprocess.run(
+                        ["lpass", "status"], check=True, capture_output=True, text=True
+                    )
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    ok = False
+            cached = cls._lpass_status_cache = (now, ok)
+
+        if not cached[1]:
             raise RuntimeError(
                 "LastPass CLI not available or not logged in. "
                 "Install with 'brew install lastpass-cli' and login with 'lpass login'"
@@ -35,6 +59,10 @@ class LastPassBackend(SecretBackend):
     def get_secret(self, name: str) -> str:
         """Retrieve a secret from LastPass"""
         full_name = self._get_secret_name(name)
+        if self._ttl > 0:
+            cached = self._cache.get(full_name)
+            if cached is not None and time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
         try:
             result = subprocess.run(
                 ["lpass", "show", "--password", full_name],
@@ -42,13 +70,59 @@ class LastPassBackend(SecretBackend):
                 capture_output=True,
                 text=True,
             )
-            return result.stdout.strip()
         except subprocess.CalledProcessError:
             raise KeyError(f"Secret '{name}' not found in LastPass")
+        value = result.stdout.strip()
+        if self._ttl > 0:
+            self._cache[full_name] = (time.monotonic(), value)
+        return value
+
+    def get_secrets(self, names: List[str]) -> Dict[str, str]:
+        """Retrieve several secrets from LastPass with a single lpass call"""
+        values = {}
+        pending = {}
+        now = time.monotonic()
+        for name in names:
+            full_name = self._get_secret_name(name)
+            cached = self._cache.get(full_name) if self._ttl > 0 else None
+            if cached is not None and now - cached[0] < self._ttl:
+                values[name] = cached[1]
+            else:
+                pending[full_name] = name
+        if not pending:
+            return values
+
+        try:
+            result = subprocess.run(
+                ["lpass", "show", "--json", *pending],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError:
+            missing = ", ".join(pending.values())
+            raise KeyError(f"Secrets '{missing}' not found in LastPass")
+
+        now = time.monotonic()
+        for entry in json.loads(result.stdout):
+            full_name = entry.get("fullname")
+            name = pending.pop(full_name, None)
+            if name is None:
+                continue
+            value = entry.get("password", "").strip()
+            values[name] = value
+            if self._ttl > 0:
+                self._cache[full_name] = (now, value)
+
+        if pending:
+            missing = ", ".join(pending.values())
+            raise KeyError(f"Secrets '{missing}' not found in LastPass")
+        return values
 
     def set_secret(self, name: str, value: str) -> None:
         """Store a secret in LastPass"""
         full_name = self._get_secret_name(name)
+        self._cache.pop(full_name, None)
         # Create a secure note with the secret
         process = subprocess.Popen(
             ["lpass", "add", "--non-interactive", "--note", full_name],
@@ -65,19 +139,18 @@ class LastPassBackend(SecretBackend):
             result = subprocess.run(
                 ["lpass", "ls", self.folder], check=True, capture_output=True, text=True
             )
-            secrets = {}
-            for line in result.stdout.strip().split("\n"):
-                if line and "/" in line:
-                    # Parse LastPass ls output
-                    name = line.split("/")[-1].split(" [")[0]
-                    secrets[name] = f"{self.folder}/{name}"
-            return secrets
+            # Parse LastPass ls output in one pass over the whole blob
+            return {
+                m.group(1): f"{self.folder}/{m.group(1)}"
+                for m in _LPASS_LS_RE.finditer(result.stdout)
+            }
         except subprocess.CalledProcessError:
             return {}
 
     def delete_secret(self, name: str) -> None:
         """Delete a secret from LastPass"""
         full_name = self._get_secret_name(name)
+        self._cache.pop(full_name, None)
         try:
             subprocess.run(["lpass", "rm", full_name], check=True, capture_output=True)
         except subprocess.CalledProcessError:
@@ -3,25 +3,79 @@ MCP Hub Workspace Management
 Handles portable, shareable MCP server configurations
 """
 
-import hashlib
+import copy
+import io
 import json
 import os
+import re
 import shutil
-from dataclasses import asdict, dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 
 # Use safe yaml loading - install pyyaml if needed
 try:
     import yaml
+
+    # libyaml's C loader/dumper are much faster, when PyYAML was built with it
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
 except ImportError:
     print("Warning: PyYAML not found. Install with: pip install pyyaml")
     # Fallback to JSON for now
     yaml = None
 
+# orjson is several times faster for workspace JSON; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ${VAR_NAME} substitutions in "KEY=${VAR_NAME}" environment entries; entries
+# are newline-joined, so a match must not run across them
+_ENV_SUB_RE = re.compile(r"=\$\{([^}\n]+)\}")
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, compact unless indent is set"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(blob: bytes) -> Any:
+    """Decode JSON from bytes"""
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _export_ignore(workspace_dir: Path):
+    """copytree filter leaving manager-internal files out of a git export"""
+    services_dir = workspace_dir / "services"
+
+    def ignore(directory: str, names: List[str]) -> List[str]:
+        ignored = [name for name in names if name.endswith(".tmp")]
+        if Path(directory) == workspace_dir:
+            # The export gets its own workspace.yml
+            ignored += [name for name in names if name == "workspace.json"]
+        elif Path(directory) == services_dir:
+            # Internal JSON service files, regenerated as YAML by the export
+            ignored += [name for name in names if name.endswith(".json")]
+        return ignored
+
+    return ignore
+
 
 @dataclass
 class MCPWorkspace:
@@ -67,14 +121,42 @@ class MCPWorkspace:
             self.created_at = datetime.now().isoformat()
 
 
+# Field names for shallow dict conversion; asdict would deep-copy services
+_FIELDS = tuple(f.name for f in fields(MCPWorkspace))
+
+
 class WorkspaceManager:
     """Manages MCP workspaces - creation, import, export, sharing"""
 
-    def __init__(self, workspaces_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        workspaces_dir: Optional[Path] = None,
+        internal_format: str = "json",
+        split_services: bool = False,
+    ):
         self.workspaces_dir = workspaces_dir or (Path.home() / ".mcpctl" / "workspaces")
+        # Metadata only mcpctl reads is stored as JSON; YAML is produced on export
+        self.internal_format = internal_format
+        # Per-service files duplicate docker-compose.yml, only useful for VCS diffs
+        self.split_services = split_services
         self.workspaces_dir.mkdir(parents=True, exist_ok=True)
+        # Directories already created or seen by this manager, skips mkdir calls
+        self._known_dirs = {self.workspaces_dir}
+        # Sidecar with listing metadata so listing never parses workspace files
+        self.index_file = self.workspaces_dir / "_index.json"
+        # Parsed workspaces keyed by name, valid while file and mtime match
+        self._load_cache: Dict[str, Tuple[Path, int, MCPWorkspace]] = {}
+        # YAML file bytes and parsed document (built on the first hit) keyed
+        # by path, valid while st_mtime_ns matches
+        self._yaml_cache: Dict[Path, Tuple[int, bytes, Any]] = {}
         self.active_workspace_file = Path.home() / ".mcpctl" / "active_workspace"
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory unless this manager already made sure it exists"""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
     def create_workspace(
         self, name: str, description: str = "", author: str = ""
     ) -> MCPWorkspace:
@@ -82,22 +164,30 @@ class WorkspaceManager:
         workspace = MCPWorkspace(name=name, description=description, author=author)
 
         workspace_dir = self.workspaces_dir / name
-        workspace_dir.mkdir(exist_ok=True)
+        self._ensure_dir(workspace_dir)
 
         self.save_workspace(workspace)
         return workspace
 
-    def save_workspace(self, workspace: MCPWorkspace) -> None:
-        """Save workspace to disk"""
-        workspace.updated_at = datetime.now().isoformat()
-        workspace_dir = self.workspaces_dir / workspace.name
-        workspace_dir.mkdir(exist_ok=True)
+    def _serialize_metadata(self, data: Dict[str, Any], suffix: str) -> bytes:
+        """Serialize metadata as compact JSON or YAML depending on the suffix"""
+        if suffix == ".json":
+            return _json_dumps(data)
+        if yaml:
+            return yaml.dump(
+                data, Dumper=SafeDumper, default_flow_style=False, encoding="utf-8"
+            )
+        return _json_dumps(data, indent=True)
 
-        # Save workspace metadata
-        workspace_file = workspace_dir / "workspace.yml"
+    def _dump_metadata(self, data: Dict[str, Any], path: Path) -> None:
+        """Serialize metadata in memory and write it in one call"""
+        blob = self._serialize_metadata(data, path.suffix)
+        with open(path, "wb") as f:
+            f.write(blob)
 
-        # Prepare workspace data for saving
-        workspace_data = asdict(workspace)
+    def _workspace_data(self, workspace: MCPWorkspace) -> Dict[str, Any]:
+        """Prepare workspace data for saving"""
+        workspace_data = {n: getattr(workspace, n) for n in _FIELDS}
 
         # Handle encrypted secrets specially
         if isinstance(workspace.secrets, dict) and workspace.secrets.get("encrypted"):
@@ -110,51 +200,44 @@ class WorkspaceManager:
                 workspace_data["secrets_template"] = workspace.secrets
                 workspace_data["secrets"] = {"encrypted": False}
 
-        if yaml:
-            with open(workspace_file, "w") as f:
-                yaml.dump(workspace_data, f, default_flow_style=False)
-        else:
-            with open(workspace_file, "w") as f:
-                json.dump(workspace_data, f, indent=2)
+        return workspace_data
+
+    def _metadata_suffixes(self) -> Tuple[str, str]:
+        """Suffix for internal metadata files and the one that would be stale"""
+        if self.internal_format == "json":
+            return ".json", ".yml"
+        return ".yml", ".json"
 
-        # Save docker-compose.yml
+    def _render_workspace(self, workspace: MCPWorkspace) -> Dict[str, bytes]:
+        """Serialize every file of a saved workspace, keyed by relative path"""
+        suffix, _ = self._metadata_suffixes()
+        files = {}
+
+        # Workspace metadata
+        workspace_data = self._workspace_data(workspace)
+        files[f"workspace{suffix}"] = self._serialize_metadata(workspace_data, suffix)
+
+        # docker-compose.yml
         compose_data = {
             "version": "3.8",
             "services": workspace.services,
             "networks": workspace.networks,
             "volumes": workspace.volumes,
         }
-
-        compose_file = workspace_dir / "docker-compose.yml"
-        if yaml:
-            with open(compose_file, "w") as f:
-                yaml.dump(compose_data, f, default_flow_style=False)
-        else:
-            with open(compose_file, "w") as f:
-                json.dump(compose_data, f, indent=2)
-
-        # Save individual service files
-        services_dir = workspace_dir / "services"
-        services_dir.mkdir(exist_ok=True)
-
-        for service_name, service_config in workspace.services.items():
-            service_file = services_dir / f"{service_name}.yml"
-            service_data = {"services": {service_name: service_config}}
-
-            if yaml:
-                with open(service_file, "w") as f:
-                    yaml.dump(service_data, f, default_flow_style=False)
-            else:
-                with open(service_file, "w") as f:
-                    json.dump(service_data, f, indent=2)
+        files["docker-compose.yml"] = self._serialize_metadata(compose_data, ".yml")
+
+        # Individual service files
+        if self.split_services:
+            for service_name, service_config in workspace.services.items():
+                service_data = {"services": {service_name: service_config}}
+                files[f"services/{service_name}{suffix}"] = self._serialize_metadata(
+                    service_data, suffix
+                )
 
         # Handle secrets based on encryption status
         if isinstance(workspace.secrets, dict) and workspace.secrets.get("encrypted"):
             # Encrypted secrets - create info file instead of template
-            secrets_info = workspace_dir / "secrets.info"
-            with open(secrets_info, "w") as f:
-                f.write(
-                    f"""# MCP Hub Encrypted Secrets
+            secrets_info = f"""# MCP Hub Encrypted Secrets
 # Workspace: {workspace.name}
 # 
 # This workspace uses encrypted secrets stored in the git repository.
@@ -166,47 +249,120 @@ class WorkspaceManager:
 #
 # Encrypted secrets are stored in workspace.yml and are safe to commit to git.
 """
-                )
+            files["secrets.info"] = secrets_info.encode("utf-8")
         else:
             # Legacy unencrypted - create template
             secrets_template = workspace_data.get("secrets_template", {})
             if secrets_template:
-                secrets_file = workspace_dir / "secrets.env.template"
-                with open(secrets_file, "w") as f:
-                    f.write("# MCP Hub Secrets Template\n")
-                    f.write(
-                        "# Copy this file to secrets.env and fill in your values\n\n"
-                    )
-                    for key, description in secrets_template.items():
-                        f.write(f"# {description}\n")
-                        f.write(f"{key}=\n\n")
-
-        # Save README
+                lines = [
+                    "# MCP Hub Secrets Template\n",
+                    "# Copy this file to secrets.env and fill in your values\n\n",
+                ]
+                for key, description in secrets_template.items():
+                    lines.append(f"# {description}\n{key}=\n\n")
+                files["secrets.env.template"] = "".join(lines).encode("utf-8")
+
+        # README
         if workspace.readme:
-            readme_file = workspace_dir / "README.md"
-            with open(readme_file, "w") as f:
-                f.write(workspace.readme)
+            files["README.md"] = workspace.readme.encode("utf-8")
+
+        return files
+
+    def _write_file(self, item: Tuple[Path, bytes]) -> None:
+        """Write one workspace file atomically via a temporary file"""
+        target, blob = item
+        tmp_file = target.with_name(target.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_file, target)
+
+    def save_workspace(self, workspace: MCPWorkspace) -> Dict[str, bytes]:
+        """Save workspace to disk, returning the written files by relative path"""
+        workspace.updated_at = datetime.now().isoformat()
+        workspace_dir = self.workspaces_dir / workspace.name
+        self._ensure_dir(workspace_dir)
+        self._load_cache.pop(workspace.name, None)
+
+        files = self._render_workspace(workspace)
+        services_dir = workspace_dir / "services"
+        if self.split_services:
+            self._ensure_dir(services_dir)
+        items = [(workspace_dir / relpath, blob) for relpath, blob in files.items()]
+        if len(items) > 4:
+            # Files are independent, overlap the open/write/rename round trips
+            with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+                list(executor.map(self._write_file, items))
+        else:
+            for item in items:
+                self._write_file(item)
+
+        # Internal metadata uses JSON, the YAML copy would only go stale
+        suffix, stale_suffix = self._metadata_suffixes()
+        (workspace_dir / f"workspace{stale_suffix}").unlink(missing_ok=True)
+        if self.split_services:
+            for service_name in workspace.services:
+                (services_dir / f"{service_name}{stale_suffix}").unlink(missing_ok=True)
+        elif services_dir.exists():
+            # Drop copies from earlier saves so they cannot drift from compose
+            for service_name in workspace.services:
+                (services_dir / f"{service_name}.json").unlink(missing_ok=True)
+                (services_dir / f"{service_name}.yml").unlink(missing_ok=True)
+
+        self._update_index(workspace)
+        return files
+
+    def _workspace_file(self, workspace_dir: Path) -> Optional[Path]:
+        """Locate workspace metadata, preferring the internal JSON copy"""
+        for filename in ("workspace.json", "workspace.yml"):
+            workspace_file = workspace_dir / filename
+            if workspace_file.exists():
+                return workspace_file
+        return None
+
+    def _cached_yaml_load(self, path: Path) -> Any:
+        """Parse a YAML file, reusing the last parse while it is unchanged"""
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._yaml_cache.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            # A miss hands out the fresh parse as-is; the bytes are kept so a
+            # later hit can build a pristine document to clone from
+            blob = path.read_bytes()
+            self._yaml_cache[path] = (mtime_ns, blob, None)
+            return yaml.load(blob, Loader=SafeLoader)
+
+        _, blob, document = cached
+        if document is None:
+            document = yaml.load(blob, Loader=SafeLoader)
+            self._yaml_cache[path] = (mtime_ns, blob, document)
+        # Callers mutate what they load, keep the cached document pristine
+        return copy.deepcopy(document)
 
     def load_workspace(self, name: str) -> Optional[MCPWorkspace]:
         """Load workspace from disk"""
-        workspace_file = self.workspaces_dir / name / "workspace.yml"
-        if not workspace_file.exists():
+        workspace_file = self._workspace_file(self.workspaces_dir / name)
+        if workspace_file is None:
             return None
 
         try:
-            if yaml:
-                with open(workspace_file, "r") as f:
-                    data = yaml.safe_load(f)
+            mtime_ns = workspace_file.stat().st_mtime_ns
+            cached = self._load_cache.get(name)
+            if cached and cached[0] == workspace_file and cached[1] == mtime_ns:
+                # Callers may mutate the workspace, hand out a private copy
+                return copy.deepcopy(cached[2])
+
+            if workspace_file.suffix == ".json" or not yaml:
+                data = _json_loads(workspace_file.read_bytes())
             else:
-                with open(workspace_file, "r") as f:
-                    data = json.load(f)
+                data = self._cached_yaml_load(workspace_file)
 
             # Handle legacy format conversion
             if "secrets_template" in data:
                 # Convert old template format to new format
                 data["secrets"] = data.pop("secrets_template")
 
-            return MCPWorkspace(**data)
+            workspace = MCPWorkspace(**data)
+            self._load_cache[name] = (workspace_file, mtime_ns, workspace)
+            return copy.deepcopy(workspace)
         except Exception as e:
             typer.echo(f"Error loading workspace {name}: {e}", err=True)
             return None
@@ -235,16 +391,84 @@ class WorkspaceManager:
             # Unencrypted secrets
             return workspace.secrets or {}
 
+    def _metadata_stamp(self, name: str) -> Optional[List[int]]:
+        """mtime and size of a workspace's metadata file, None if it has none"""
+        workspace_file = self._workspace_file(self.workspaces_dir / name)
+        if workspace_file is None:
+            return None
+        stat = workspace_file.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _index_entry(self, workspace: MCPWorkspace) -> Dict[str, Any]:
+        """Listing metadata kept in the index for one workspace"""
+        return {
+            "updated_at": workspace.updated_at,
+            "description": workspace.description,
+            "tags": workspace.tags,
+            "stamp": self._metadata_stamp(workspace.name),
+        }
+
+    def _read_index(self) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """Read the workspace index, None if it is missing or unreadable"""
+        try:
+            return _json_loads(self.index_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, index: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Replace the workspace index atomically"""
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(index))
+        os.replace(tmp_file, self.index_file)
+
+    def _update_index(self, workspace: MCPWorkspace) -> None:
+        """Record a saved or imported workspace in the index"""
+        index = self._read_index()
+        if index is None:
+            index = self.workspace_index()
+        index[workspace.name] = self._index_entry(workspace)
+        self._write_index(index)
+
+    def workspace_index(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Listing metadata per workspace, None for workspaces that fail to load"""
+        index = self._read_index()
+        changed = index is None
+        if index is None:
+            index = {}
+
+        # Workspaces removed, added or edited outside the manager (rm, git
+        # pull, hand edits) are found by name and metadata stamp; only those
+        # are parsed again, and entries that failed to load are always retried
+        with os.scandir(self.workspaces_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+        for name in set(index) - names:
+            del index[name]
+            changed = True
+        for name in sorted(names):
+            stamp = self._metadata_stamp(name)
+            entry = index.get(name)
+            if stamp is None:
+                if name in index:
+                    del index[name]
+                    changed = True
+                continue
+            if entry is not None and entry.get("stamp") == stamp:
+                continue
+
+            workspace = self.load_workspace(name)
+            entry = self._index_entry(workspace) if workspace else None
+            if name not in index or index[name] != entry:
+                index[name] = entry
+                changed = True
+
+        if changed:
+            self._write_index(index)
+        return index
+
     def list_workspaces(self) -> List[str]:
         """List all available workspaces"""
-        if not self.workspaces_dir.exists():
-            return []
-
-        workspaces = []
-        for item in self.workspaces_dir.iterdir():
-            if item.is_dir() and (item / "workspace.yml").exists():
-                workspaces.append(item.name)
-        return sorted(workspaces)
+        return sorted(self.workspace_index())
 
     def export_workspace(
         self, name: str, output_path: Path, format: str = "bundle"
@@ -255,28 +479,68 @@ class WorkspaceManager:
             raise ValueError(f"Workspace '{name}' not found")
 
         workspace_dir = self.workspaces_dir / name
+        workspace_data = self._workspace_data(workspace)
 
         if format == "bundle":
             # Create a tar.gz bundle
             import tarfile
 
-            with tarfile.open(output_path, "w:gz") as tar:
-                tar.add(workspace_dir, arcname=name)
+            # Generated files come from memory, shared bundles always carry
+            # the human-readable workspace.yml
+            files = self._render_workspace(workspace)
+            files.setdefault(
+                "workspace.yml", self._serialize_metadata(workspace_data, ".yml")
+            )
+            mtime = int(time.time())
+
+            with tarfile.open(output_path, "w:gz", compresslevel=1) as tar:
+                # Directories and user files are still taken from disk
+                tar.add(workspace_dir, arcname=name, recursive=False)
+                for path in sorted(workspace_dir.rglob("*")):
+                    relpath = path.relative_to(workspace_dir).as_posix()
+                    if relpath not in files:
+                        tar.add(path, arcname=f"{name}/{relpath}", recursive=False)
+
+                for relpath, blob in files.items():
+                    info = tarfile.TarInfo(f"{name}/{relpath}")
+                    info.size = len(blob)
+                    info.mtime = mtime
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(blob))
 
         elif format == "git":
             # Create a git repository structure
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files
-            shutil.copytree(workspace_dir, output_path / name, dirs_exist_ok=True)
+            self._ensure_dir(output_path)
+
+            # Copy all files; users edit the export, so it must not share
+            # inodes with the stored workspace
+            export_dir = output_path / name
+            shutil.copytree(
+                workspace_dir,
+                export_dir,
+                ignore=_export_ignore(workspace_dir),
+                dirs_exist_ok=True,
+            )
+
+            # Imports from a directory expect workspace.yml
+            self._dump_metadata(workspace_data, export_dir / "workspace.yml")
+
+            # Per-service files exist for VCS diffs, export them as YAML
+            services_dir = workspace_dir / "services"
+            if services_dir.is_dir() and any(services_dir.iterdir()):
+                for service_name, service_config in workspace.services.items():
+                    self._dump_metadata(
+                        {"services": {service_name: service_config}},
+                        export_dir / "services" / f"{service_name}.yml",
+                    )
 
             # Create .gitignore
-            gitignore = output_path / name / ".gitignore"
+            gitignore = export_dir / ".gitignore"
             with open(gitignore, "w") as f:
                 f.write("secrets.env\n*.log\ndata/\n.env\n")
 
             # Create installation script
-            install_script = output_path / name / "install.sh"
+            install_script = export_dir / "install.sh"
             with open(install_script, "w") as f:
                 f.write(
                     f"""#!/bin/bash
@@ -304,8 +568,10 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
 
         elif format == "json":
             # Export as single JSON file
-            with open(output_path, "w") as f:
-                json.dump(asdict(workspace), f, indent=2)
+            data = {n: getattr(workspace, n) for n in _FIELDS}
+            blob = _json_dumps(data, indent=True)
+            with open(output_path, "wb") as f:
+                f.write(blob)
 
     def import_workspace(self, source_path: Path, activate: bool = False) -> str:
         """Import workspace from various sources"""
@@ -316,15 +582,29 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
             with tarfile.open(source_path, "r:gz") as tar:
                 tar.extractall(self.workspaces_dir)
                 # Get the workspace name from the extracted directory
-                extracted_dirs = [name for name in tar.getnames() if "/" not in name]
+                members = set(tar.getnames())
+                extracted_dirs = [name for name in members if "/" not in name]
                 workspace_name = (
                     extracted_dirs[0] if extracted_dirs else source_path.stem
                 )
 
+            # Metadata the bundle did not carry is left over from the old
+            # workspace and would shadow what was imported (YAML-only bundles)
+            workspace_dir = self.workspaces_dir / workspace_name
+            for filename in ("workspace.json", "workspace.yml"):
+                self._yaml_cache.pop(workspace_dir / filename, None)
+                if f"{workspace_name}/{filename}" not in members:
+                    (workspace_dir / filename).unlink(missing_ok=True)
+            self._load_cache.pop(workspace_name, None)
+
+            # Extracted directly, so save_workspace did not index it
+            workspace = self.load_workspace(workspace_name)
+            if workspace:
+                self._update_index(workspace)
+
         elif source_path.suffix == ".json":
             # Import from JSON file
-            with open(source_path, "r") as f:
-                data = json.load(f)
+            data = _json_loads(source_path.read_bytes())
             workspace = MCPWorkspace(**data)
             self.save_workspace(workspace)
             workspace_name = workspace.name
@@ -350,8 +630,9 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
     def load_workspace_from_path(self, path: Path) -> MCPWorkspace:
         """Load workspace from a directory path"""
         workspace_file = path / "workspace.yml"
-        with open(workspace_file, "r") as f:
-            data = yaml.safe_load(f)
+        data = self._cached_yaml_load(workspace_file)
+        if "secrets_template" in data:
+            data["secrets"] = data.pop("secrets_template")
         return MCPWorkspace(**data)
 
     def activate_workspace(self, name: str) -> None:
@@ -360,6 +641,10 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
         if not workspace:
             raise ValueError(f"Workspace '{name}' not found")
 
+        # Re-activating the active workspace leaves the file untouched
+        if self.get_active_workspace() == name:
+            return
+
         with open(self.active_workspace_file, "w") as f:
             f.write(name)
 
@@ -387,10 +672,9 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
 
         if services_dir.exists():
             for service_file in services_dir.glob("*.yml"):
-                with open(service_file, "r") as f:
-                    service_data = yaml.safe_load(f)
-                    if "services" in service_data:
-                        services.update(service_data["services"])
+                service_data = self._cached_yaml_load(service_file)
+                if "services" in service_data:
+                    services.update(service_data["services"])
 
         # Read current compose file
         compose_file = Path(config.compose_file)
@@ -398,20 +682,18 @@ echo "📝 Don't forget to copy secrets.env.template to secrets.env and fill in
         volumes = {}
 
         if compose_file.exists():
-            with open(compose_file, "r") as f:
-                compose_data = yaml.safe_load(f)
-                networks = compose_data.get("networks", networks)
-                volumes = compose_data.get("volumes", volumes)
+            compose_data = self._cached_yaml_load(compose_file)
+            networks = compose_data.get("networks", networks)
+            volumes = compose_data.get("volumes", volumes)
 
         # Extract secrets from environment variables
         secrets = {}
         for service_name, service_config in services.items():
             env_vars = service_config.get("environment", [])
-            for env_var in env_vars:
-                if isinstance(env_var, str) and "=${" in env_var:
-                    # Extract variable name from ${VAR_NAME} format
-                    var_name = env_var.split("=${")[1].rstrip("}")
-                    secrets[var_name] = f"Secret for {service_name}"
+            # One regex pass over all of the service's string entries
+            env_text = "\n".join(e for e in env_vars if isinstance(e, str))
+            for var_name in _ENV_SUB_RE.findall(env_text):
+                secrets[var_name] = f"Secret for {service_name}"
 
         workspace = MCPWorkspace(
             name=name,
@@ -40,4 +40,29 @@ else:
     print('❌ Failed to load workspace')
 "
 
+# Test git export tree
+echo "📤 Testing git export..."
+python3 -c "
+import sys
+import tempfile
+from pathlib import Path
+from mcpctl.workspace import WorkspaceManager
+root = Path(tempfile.mkdtemp())
+manager = WorkspaceManager(root / 'workspaces', split_services=True)
+workspace = manager.create_workspace('export-test', 'Export test')
+workspace.services = {'web': {'image': 'nginx'}}
+manager.save_workspace(workspace)
+manager.export_workspace('export-test', root / 'export', format='git')
+export_dir = root / 'export' / 'export-test'
+files = sorted(p.relative_to(export_dir).as_posix() for p in export_dir.rglob('*') if p.is_file())
+expected = ['.gitignore', 'docker-compose.yml', 'install.sh', 'services/web.yml', 'workspace.yml']
+if files != expected:
+    print(f'❌ Unexpected export tree: {files}')
+    sys.exit(1)
+if any((export_dir / f).stat().st_nlink > 1 for f in files):
+    print('❌ Export shares files with the stored workspace')
+    sys.exit(1)
+print(f'✅ Exported tree: {files}')
+"
+
 echo "🎉 Workspace system tests passed!"
@@ -9,6 +9,106 @@ import json
 
 import aiohttp
 
+# orjson speeds up request/response JSON when installed
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+PROXY_URL = "http://localhost:3000"
+
+
+async def post_rpc(session: aiohttp.ClientSession, request: dict) -> dict:
+    """POST a JSON-RPC request to the proxy and decode the reply"""
+    async with session.post(
+        PROXY_URL,
+        json=request,
+        headers={"Content-Type": "application/json"},
+    ) as resp:
+        return json_loads(await resp.read())
+
+
+async def initialize(session: aiohttp.ClientSession) -> list:
+    """Test 2: Initialize MCP connection"""
+    lines = ["\n2. MCP Initialize"]
+    initialize_request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "mcp-hub-test", "version": "1.0.0"},
+        },
+    }
+
+    try:
+        data = await post_rpc(session, initialize_request)
+        capabilities = data.get("result", {}).get("capabilities", {})
+        lines.append(
+            f"   ✅ Protocol version: {data.get('result', {}).get('protocolVersion')}"
+        )
+        lines.append(f"   🔧 Aggregated capabilities: {list(capabilities.keys())}")
+    except Exception as e:
+        lines.append(f"   ❌ Initialize failed: {e}")
+    return lines
+
+
+async def list_tools(session: aiohttp.ClientSession) -> list:
+    """Test 3: List tools"""
+    lines = ["\n3. List Available Tools"]
+    tools_request = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/list",
+        "params": {},
+    }
+
+    try:
+        data = await post_rpc(session, tools_request)
+        tools = data.get("result", {}).get("tools", [])
+        lines.append(f"   ✅ Found {len(tools)} tools across all servers:")
+        for tool in tools[:5]:  # Show first 5
+            server = tool.get("_server", "unknown")
+            name = tool.get("name", "unnamed")
+            lines.append(f"      🔧 {name} (from {server})")
+        if len(tools) > 5:
+            lines.append(f"      ... and {len(tools) - 5} more")
+    except Exception as e:
+        lines.append(f"   ❌ Tools list failed: {e}")
+    return lines
+
+
+async def list_resources(session: aiohttp.ClientSession) -> list:
+    """Test 4: List resources"""
+    lines = ["\n4. List Available Resources"]
+    resources_request = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "resources/list",
+        "params": {},
+    }
+
+    try:
+        data = await post_rpc(session, resources_request)
+        resources = data.get("result", {}).get("resources", [])
+        lines.append(f"   ✅ Found {len(resources)} resources across all servers:")
+        for resource in resources[:3]:  # Show first 3
+            server = resource.get("_server", "unknown")
+            uri = resource.get("uri", "no-uri")
+            lines.append(f"      📄 {uri} (from {server})")
+        if len(resources) > 3:
+            lines.append(f"      ... and {len(resources) - 3} more")
+    except Exception as e:
+        lines.append(f"   ❌ Resources list failed: {e}")
+    return lines
+
 
 async def test_proxy():
     """Test the MCP proxy functionality"""
@@ -16,100 +116,29 @@ async def test_proxy():
     print("🧪 Testing MCP Hub Proxy")
     print("========================")
 
-    async with aiohttp.ClientSession() as session:
+    # Keep-alive pool so the concurrent calls reuse warm connections
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+    async with aiohttp.ClientSession(
+        connector=connector, json_serialize=json_dumps
+    ) as session:
 
         # Test 1: Health check
         print("\n1. Health Check")
         try:
-            async with session.get("http://localhost:3000/health") as resp:
-                data = await resp.json()
+            async with session.get(f"{PROXY_URL}/health") as resp:
+                data = json_loads(await resp.read())
                 print(f"   ✅ Proxy health: {data['status']}")
                 print(f"   📊 Servers: {data['healthy_servers']}/{data['servers']}")
         except Exception as e:
             print(f"   ❌ Health check failed: {e}")
             return
 
-        # Test 2: Initialize MCP connection
-        print("\n2. MCP Initialize")
-        initialize_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "mcp-hub-test", "version": "1.0.0"},
-            },
-        }
-
-        try:
-            async with session.post(
-                "http://localhost:3000",
-                json=initialize_request,
-                headers={"Content-Type": "application/json"},
-            ) as resp:
-                data = await resp.json()
-                capabilities = data.get("result", {}).get("capabilities", {})
-                print(
-                    f"   ✅ Protocol version: {data.get('result', {}).get('protocolVersion')}"
-                )
-                print(f"   🔧 Aggregated capabilities: {list(capabilities.keys())}")
-        except Exception as e:
-            print(f"   ❌ Initialize failed: {e}")
-
-        # Test 3: List tools
-        print("\n3. List Available Tools")
-        tools_request = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {},
-        }
-
-        try:
-            async with session.post(
-                "http://localhost:3000",
-                json=tools_request,
-                headers={"Content-Type": "application/json"},
-            ) as resp:
-                data = await resp.json()
-                tools = data.get("result", {}).get("tools", [])
-                print(f"   ✅ Found {len(tools)} tools across all servers:")
-                for tool in tools[:5]:  # Show first 5
-                    server = tool.get("_server", "unknown")
-                    name = tool.get("name", "unnamed")
-                    print(f"      🔧 {name} (from {server})")
-                if len(tools) > 5:
-                    print(f"      ... and {len(tools) - 5} more")
-        except Exception as e:
-            print(f"   ❌ Tools list failed: {e}")
-
-        # Test 4: List resources
-        print("\n4. List Available Resources")
-        resources_request = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "resources/list",
-            "params": {},
-        }
-
-        try:
-            async with session.post(
-                "http://localhost:3000",
-                json=resources_request,
-                headers={"Content-Type": "application/json"},
-            ) as resp:
-                data = await resp.json()
-                resources = data.get("result", {}).get("resources", [])
-                print(f"   ✅ Found {len(resources)} resources across all servers:")
-                for resource in resources[:3]:  # Show first 3
-                    server = resource.get("_server", "unknown")
-                    uri = resource.get("uri", "no-uri")
-                    print(f"      📄 {uri} (from {server})")
-                if len(resources) > 3:
-                    print(f"      ... and {len(resources) - 3} more")
-        except Exception as e:
-            print(f"   ❌ Resources list failed: {e}")
+        # Tests 2-4 are independent, run them together and report in order
+        results = await asyncio.gather(
+            initialize(session), list_tools(session), list_resources(session)
+        )
+        for lines in results:
+            print("\n".join(lines))
 
     print("\n🎉 Proxy test complete!")
     print("\n📋 To use with your LLM client:")
@@ -9,11 +9,46 @@ import json
 import os
 import signal
 import subprocess
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import aiohttp
 
+# orjson speeds up request/response JSON when installed
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
+
+# The JSON-RPC probes never change, so their bodies are encoded once
+_INIT_BODY = json_dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "mcp-hub-test", "version": "1.0.0"},
+        },
+    }
+)
+_TOOLS_BODY = json_dumps(
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
+)
+_RES_BODY = json_dumps(
+    {"jsonrpc": "2.0", "id": 3, "method": "resources/list", "params": {}}
+)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class ProxyTestSuite:
     """Complete test suite for MCP Hub proxy functionality"""
@@ -22,17 +57,35 @@ class ProxyTestSuite:
         self.base_url = "http://localhost:3000"
         self.test_results = []
         self.proxy_pid = None
+        self._session = None
+        # CLI checks log from worker threads
+        self._log_lock = threading.Lock()
+
+    async def setup(self):
+        """Open the HTTP session shared by all protocol probes"""
+        # Keep-alive has to outlast the CLI steps between probes
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=32,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            force_close=False,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=15)
+        )
 
     def log_test(self, test_name: str, success: bool, message: str = ""):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if message:
-            print(f"   {message}")
+        with self._log_lock:
+            print(f"{status} {test_name}")
+            if message:
+                print(f"   {message}")
 
-        self.test_results.append(
-            {"test": test_name, "success": success, "message": message}
-        )
+            self.test_results.append(
+                {"test": test_name, "success": success, "message": message}
+            )
 
     def run_command(self, cmd: list, timeout: int = 30):
         """Run a command and return result"""
@@ -56,6 +109,50 @@ class ProxyTestSuite:
         except Exception as e:
             return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
 
+    async def _run_command_async(self, cmd: list, timeout: int = 30):
+        """Run a command without blocking the event loop and return result"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": "Command timed out",
+                "returncode": -1,
+            }
+
+        return {
+            "success": proc.returncode == 0,
+            "stdout": stdout.decode(errors="replace"),
+            "stderr": stderr.decode(errors="replace"),
+            "returncode": proc.returncode,
+        }
+
+    async def _wait_ready(self, url: str, timeout: float = 10) -> bool:
+        """Poll url with exponential backoff until it answers 200"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while loop.time() < deadline:
+            try:
+                async with self._session.get(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return True
+            except Exception:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        return False
+
     def test_mcpctl_available(self):
         """Test that mcpctl command is available"""
         result = self.run_command(["mcpctl", "--version"])
@@ -84,13 +181,13 @@ class ProxyTestSuite:
         )
         return result["success"]
 
-    def test_services_setup(self):
+    async def test_services_setup(self):
         """Test that basic services are configured"""
         # Check if docker-compose.yml exists
         compose_file = Path("docker-compose.yml")
         if not compose_file.exists():
             # Generate one for testing
-            result = self.run_command(["mcpctl", "generate"])
+            result = await self._run_command_async(["mcpctl", "generate"])
             if not result["success"]:
                 self.log_test(
                     "Services setup", False, "Failed to generate compose file"
@@ -100,14 +197,11 @@ class ProxyTestSuite:
         self.log_test("Services setup", True, "docker-compose.yml available")
         return True
 
-    def test_start_services(self):
+    async def test_start_services(self):
         """Test starting MCP services"""
         print("\n📦 Starting MCP services...")
-        result = self.run_command(["mcpctl", "start"], timeout=60)
-
-        if result["success"]:
-            # Wait for services to be ready
-            time.sleep(5)
+        # No fixed warm-up: proxy start waits for its backends to be healthy
+        result = await self._run_command_async(["mcpctl", "start"], timeout=60)
 
         self.log_test(
             "Start services",
@@ -116,14 +210,20 @@ class ProxyTestSuite:
         )
         return result["success"]
 
-    def test_proxy_start(self):
+    async def test_proxy_start(self):
         """Test starting the proxy"""
         print("\n🚀 Starting MCP proxy...")
-        result = self.run_command(["mcpctl", "proxy", "start", "--background"])
+        result = await self._run_command_async(
+            ["mcpctl", "proxy", "start", "--background"]
+        )
 
         if result["success"]:
-            # Wait for proxy to start
-            time.sleep(3)
+            # Wait for proxy to start, returning as soon as it answers
+            if not await self._wait_ready(f"{self.base_url}/health"):
+                self.log_test(
+                    "Start proxy", False, "Proxy did not answer /health in time"
+                )
+                return False
 
         self.log_test(
             "Start proxy",
@@ -135,21 +235,18 @@ class ProxyTestSuite:
     async def test_proxy_health(self):
         """Test proxy health endpoint"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/health", timeout=10) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.log_test(
-                            "Proxy health check",
-                            True,
-                            f"Status: {data.get('status')}, Servers: {data.get('servers', 0)}",
-                        )
-                        return True
-                    else:
-                        self.log_test(
-                            "Proxy health check", False, f"HTTP {resp.status}"
-                        )
-                        return False
+            async with self._session.get(f"{self.base_url}/health", timeout=10) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    self.log_test(
+                        "Proxy health check",
+                        True,
+                        f"Status: {data.get('status')}, Servers: {data.get('servers', 0)}",
+                    )
+                    return True
+                else:
+                    self.log_test("Proxy health check", False, f"HTTP {resp.status}")
+                    return False
         except Exception as e:
             self.log_test("Proxy health check", False, str(e))
             return False
@@ -157,43 +254,31 @@ class ProxyTestSuite:
     async def test_mcp_initialize(self):
         """Test MCP initialize protocol"""
         try:
-            initialize_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "mcp-hub-test", "version": "1.0.0"},
-                },
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    json=initialize_request,
-                    headers={"Content-Type": "application/json"},
-                    timeout=15,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if "result" in data:
-                            capabilities = data["result"].get("capabilities", {})
-                            self.log_test(
-                                "MCP initialize",
-                                True,
-                                f"Protocol version: {data['result'].get('protocolVersion')}, "
-                                f"Capabilities: {list(capabilities.keys())}",
-                            )
-                            return True
-                        else:
-                            self.log_test(
-                                "MCP initialize", False, f"Error: {data.get('error')}"
-                            )
-                            return False
+            async with self._session.post(
+                self.base_url,
+                data=_INIT_BODY,
+                headers=_JSON_HEADERS,
+                timeout=15,
+            ) as resp:
+                if resp.status == 200:
+                    data = json_loads(await resp.read())
+                    if "result" in data:
+                        capabilities = data["result"].get("capabilities", {})
+                        self.log_test(
+                            "MCP initialize",
+                            True,
+                            f"Protocol version: {data['result'].get('protocolVersion')}, "
+                            f"Capabilities: {list(capabilities.keys())}",
+                        )
+                        return True
                     else:
-                        self.log_test("MCP initialize", False, f"HTTP {resp.status}")
+                        self.log_test(
+                            "MCP initialize", False, f"Error: {data.get('error')}"
+                        )
                         return False
+                else:
+                    self.log_test("MCP initialize", False, f"HTTP {resp.status}")
+                    return False
         except Exception as e:
             self.log_test("MCP initialize", False, str(e))
             return False
@@ -201,49 +286,41 @@ class ProxyTestSuite:
     async def test_tools_list(self):
         """Test tools/list aggregation"""
         try:
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {},
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    json=tools_request,
-                    headers={"Content-Type": "application/json"},
-                    timeout=15,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if "result" in data:
-                            tools = data["result"].get("tools", [])
-                            server_count = len(
-                                set(
-                                    tool.get("_server")
-                                    for tool in tools
-                                    if tool.get("_server")
-                                )
-                            )
-                            self.log_test(
-                                "Tools list aggregation",
-                                True,
-                                f"Found {len(tools)} tools from {server_count} servers",
-                            )
-                            return True
-                        else:
-                            self.log_test(
-                                "Tools list aggregation",
-                                False,
-                                f"Error: {data.get('error')}",
-                            )
-                            return False
+            async with self._session.post(
+                self.base_url,
+                data=_TOOLS_BODY,
+                headers=_JSON_HEADERS,
+                timeout=15,
+            ) as resp:
+                if resp.status == 200:
+                    data = json_loads(await resp.read())
+                    if "result" in data:
+                        tools = data["result"].get("tools", [])
+                        server_count = len(
+                            {
+                                server
+                                for tool in tools
+                                if (server := tool.get("_server"))
+                            }
+                        )
+                        self.log_test(
+                            "Tools list aggregation",
+                            True,
+                            f"Found {len(tools)} tools from {server_count} servers",
+                        )
+                        return True
                     else:
                         self.log_test(
-                            "Tools list aggregation", False, f"HTTP {resp.status}"
+                            "Tools list aggregation",
+                            False,
+                            f"Error: {data.get('error')}",
                         )
                         return False
+                else:
+                    self.log_test(
+                        "Tools list aggregation", False, f"HTTP {resp.status}"
+                    )
+                    return False
         except Exception as e:
             self.log_test("Tools list aggregation", False, str(e))
             return False
@@ -251,49 +328,41 @@ class ProxyTestSuite:
     async def test_resources_list(self):
         """Test resources/list aggregation"""
         try:
-            resources_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "resources/list",
-                "params": {},
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    json=resources_request,
-                    headers={"Content-Type": "application/json"},
-                    timeout=15,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if "result" in data:
-                            resources = data["result"].get("resources", [])
-                            server_count = len(
-                                set(
-                                    res.get("_server")
-                                    for res in resources
-                                    if res.get("_server")
-                                )
-                            )
-                            self.log_test(
-                                "Resources list aggregation",
-                                True,
-                                f"Found {len(resources)} resources from {server_count} servers",
-                            )
-                            return True
-                        else:
-                            self.log_test(
-                                "Resources list aggregation",
-                                False,
-                                f"Error: {data.get('error')}",
-                            )
-                            return False
+            async with self._session.post(
+                self.base_url,
+                data=_RES_BODY,
+                headers=_JSON_HEADERS,
+                timeout=15,
+            ) as resp:
+                if resp.status == 200:
+                    data = json_loads(await resp.read())
+                    if "result" in data:
+                        resources = data["result"].get("resources", [])
+                        server_count = len(
+                            {
+                                server
+                                for res in resources
+                                if (server := res.get("_server"))
+                            }
+                        )
+                        self.log_test(
+                            "Resources list aggregation",
+                            True,
+                            f"Found {len(resources)} resources from {server_count} servers",
+                        )
+                        return True
                     else:
                         self.log_test(
-                            "Resources list aggregation", False, f"HTTP {resp.status}"
+                            "Resources list aggregation",
+                            False,
+                            f"Error: {data.get('error')}",
                         )
                         return False
+                else:
+                    self.log_test(
+                        "Resources list aggregation", False, f"HTTP {resp.status}"
+                    )
+                    return False
         except Exception as e:
             self.log_test("Resources list aggregation", False, str(e))
             return False
@@ -329,10 +398,13 @@ class ProxyTestSuite:
         )
         return success
 
-    def cleanup(self):
+    async def cleanup(self):
         """Clean up test environment"""
         print("\n🧹 Cleaning up...")
 
+        if self._session is not None:
+            await self._session.close()
+
         # Stop proxy
         result = self.run_command(["mcpctl", "proxy", "stop"])
         if result["success"]:
@@ -348,6 +420,8 @@ class ProxyTestSuite:
         print("🧪 MCP Hub Proxy Test Suite")
         print("=" * 40)
 
+        await self.setup()
+
         # Basic setup tests
         if not self.test_mcpctl_available():
             print("\n❌ mcpctl not available - cannot continue")
@@ -357,29 +431,36 @@ class ProxyTestSuite:
             print("\n❌ Proxy commands not available - cannot continue")
             return False
 
-        if not self.test_services_setup():
+        if not await self.test_services_setup():
             print("\n❌ Services setup failed - cannot continue")
             return False
 
         # Start services and proxy
-        if not self.test_start_services():
+        if not await self.test_start_services():
             print("\n❌ Failed to start services")
             return False
 
-        if not self.test_proxy_start():
+        if not await self.test_proxy_start():
             print("\n❌ Failed to start proxy")
             return False
 
-        # Protocol tests
-        await self.test_proxy_health()
-        await self.test_mcp_initialize()
-        await self.test_tools_list()
-        await self.test_resources_list()
+        # Protocol tests are independent requests, issue them concurrently
+        await asyncio.gather(
+            self.test_proxy_health(),
+            self.test_mcp_initialize(),
+            self.test_tools_list(),
+            self.test_resources_list(),
+            return_exceptions=True,
+        )
 
-        # CLI tests
-        self.test_proxy_status_command()
-        self.test_proxy_servers_command()
-        self.test_connect_command()
+        # CLI tests are independent read-only commands, run them side by side
+        cli_tests = [
+            self.test_proxy_status_command,
+            self.test_proxy_servers_command,
+            self.test_connect_command,
+        ]
+        with ThreadPoolExecutor(max_workers=len(cli_tests)) as executor:
+            list(executor.map(lambda test: test(), cli_tests))
 
         # Summary
         print("\n📊 Test Results Summary")
@@ -410,7 +491,7 @@ async def main():
         print("\n\n⚠️  Tests interrupted by user")
         return 1
     finally:
-        test_suite.cleanup()
+        await test_suite.cleanup()
 
 
 if __name__ == "__main__":
@@ -5,12 +5,18 @@ Simple web service that serves the bootstrap installer script.
 Can be deployed to any hosting service or used as a reference.
 """
 
+import gzip
 import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
-from flask import Flask, Response, request, jsonify, render_template_string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request, jsonify, stream_with_context
 
 app = Flask(__name__)
 
@@ -21,6 +27,104 @@ INSTALL_SCRIPT_URL = (
     f"https://github.com/{GITHUB_REPO}/releases/latest/download/install.sh"
 )
 
+# Command-line clients that should receive the raw script
+_CLI_UA_RE = re.compile(r"curl|wget|httpie", re.I)
+
+# Local copy of the installer served when GitHub is unavailable, read once
+LOCAL_INSTALL_SCRIPT = Path(__file__).parent.parent / "scripts" / "install.sh"
+try:
+    _LOCAL_INSTALL = LOCAL_INSTALL_SCRIPT.read_bytes()
+    _LOCAL_INSTALL_GZ = gzip.compress(_LOCAL_INSTALL)
+except OSError:
+    _LOCAL_INSTALL = _LOCAL_INSTALL_GZ = None
+
+# Shared session so GitHub requests reuse pooled keep-alive connections
+_gh = requests.Session()
+_gh.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        # Hand the last 5xx back to the caller so the fallbacks still run
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Release data changes rarely, serve repeat API hits from memory. Past the
+# TTL the stale copy is still served while a background thread refreshes it,
+# so only the first request (or one after a long outage) waits on GitHub
+GITHUB_CACHE_TTL = 60.0
+GITHUB_STALE_TTL = 600.0
+_GH_CACHE = {}  # url -> (fetched_at, etag, body)
+_GH_CACHE_LOCK = threading.Lock()
+_GH_REFRESHING = set()
+
+
+def _fetch(url):
+    """GET a GitHub URL, returning (status, body, etag) and caching successes"""
+    with _GH_CACHE_LOCK:
+        cached = _GH_CACHE.get(url)
+    # Revalidate with the last ETag, a 304 costs no rate limit and no body
+    headers = {"If-None-Match": cached[1]} if cached and cached[1] else {}
+    response = _gh.get(url, headers=headers, timeout=10)
+    if response.status_code == 304 and cached:
+        with _GH_CACHE_LOCK:
+            _GH_CACHE[url] = (time.monotonic(), cached[1], cached[2])
+        return 200, cached[2], cached[1]
+    etag = response.headers.get("ETag")
+    if response.status_code == 200:
+        with _GH_CACHE_LOCK:
+            _GH_CACHE[url] = (time.monotonic(), etag, response.content)
+    return response.status_code, response.content, etag
+
+
+def _refresh(url):
+    """Re-fetch a cached URL in the background, keeping the old copy on error"""
+    try:
+        _fetch(url)
+    except Exception:
+        pass
+    finally:
+        with _GH_CACHE_LOCK:
+            _GH_REFRESHING.discard(url)
+
+
+def _cached_get(url):
+    """GET a GitHub URL through the cache, returning (status, body, etag)"""
+    now = time.monotonic()
+    refresh = False
+    with _GH_CACHE_LOCK:
+        cached = _GH_CACHE.get(url)
+        if cached and now - cached[0] >= GITHUB_STALE_TTL:
+            cached = None
+        elif cached and now - cached[0] >= GITHUB_CACHE_TTL:
+            # One refresh per URL, concurrent requests keep the stale body
+            refresh = url not in _GH_REFRESHING
+            _GH_REFRESHING.add(url)
+    if cached is None:
+        return _fetch(url)
+
+    if refresh:
+        threading.Thread(target=_refresh, args=(url,), daemon=True).start()
+    return 200, cached[2], cached[1]
+
+
+def _json_passthrough(body, etag):
+    """Relay GitHub's JSON as-is, answering a matching If-None-Match with 304"""
+    headers = {"Cache-Control": f"public, max-age={int(GITHUB_CACHE_TTL)}"}
+    if etag:
+        headers["ETag"] = etag
+        if etag in request.headers.get("If-None-Match", ""):
+            return Response(status=304, headers=headers)
+    # GitHub's JSON is passed through as-is, no re-serialization
+    return Response(body, mimetype="application/json", headers=headers)
+
+
 # HTML template for the landing page
 LANDING_PAGE = """
 <!DOCTYPE html>
@@ -199,10 +303,28 @@ curl -fsSL https://github.com/saxyguy81/mcp-hub/releases/latest/download/install
 """
 
 
+# The landing page only depends on module constants: render and gzip it once
+_RENDERED_LANDING = app.jinja_env.from_string(LANDING_PAGE).render(repo=GITHUB_REPO)
+_RENDERED_LANDING_GZ = gzip.compress(_RENDERED_LANDING.encode("utf-8"))
+
+
+def _accepts_gzip():
+    """Whether the client accepts gzip, honouring q-values such as gzip;q=0"""
+    return request.accept_encodings["gzip"] > 0
+
+
 @app.route("/")
 def landing_page():
     """Serve the landing page with installation instructions."""
-    return render_template_string(LANDING_PAGE, repo=GITHUB_REPO)
+    if _accepts_gzip():
+        return Response(
+            _RENDERED_LANDING_GZ,
+            mimetype="text/html",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        _RENDERED_LANDING, mimetype="text/html", headers={"Vary": "Accept-Encoding"}
+    )
 
 
 @app.route("/install.sh")
@@ -213,35 +335,40 @@ def install_script():
     If accessed via curl, return the script directly.
     If accessed via browser, show the landing page.
     """
-    user_agent = request.headers.get("User-Agent", "").lower()
-
     # If it's curl, wget, or similar, serve the script
-    if any(tool in user_agent for tool in ["curl", "wget", "httpie"]):
+    if _CLI_UA_RE.search(request.headers.get("User-Agent", "")):
         try:
             # Fetch the latest install script from GitHub releases
-            response = requests.get(INSTALL_SCRIPT_URL, timeout=10)
+            response = _gh.get(INSTALL_SCRIPT_URL, timeout=10, stream=True)
             if response.status_code == 200:
-                return Response(
-                    response.content,
+                # Relay chunks as they arrive instead of buffering the body
+                streamed = Response(
+                    stream_with_context(response.iter_content(chunk_size=16384)),
                     mimetype="text/plain",
                     headers={
                         "Content-Disposition": "inline; filename=install.sh",
                         "Cache-Control": "no-cache",
                     },
                 )
+                streamed.call_on_close(response.close)
+                return streamed
             else:
+                response.close()
                 # Fallback to local script if GitHub is unavailable
-                script_path = Path(__file__).parent.parent / "scripts" / "install.sh"
-                if script_path.exists():
-                    with open(script_path, "r") as f:
+                if _LOCAL_INSTALL is not None:
+                    headers = {
+                        "Content-Disposition": "inline; filename=install.sh",
+                        "Cache-Control": "no-cache",
+                        "Vary": "Accept-Encoding",
+                    }
+                    if _accepts_gzip():
+                        headers["Content-Encoding"] = "gzip"
                         return Response(
-                            f.read(),
-                            mimetype="text/plain",
-                            headers={
-                                "Content-Disposition": "inline; filename=install.sh",
-                                "Cache-Control": "no-cache",
-                            },
+                            _LOCAL_INSTALL_GZ, mimetype="text/plain", headers=headers
                         )
+                    return Response(
+                        _LOCAL_INSTALL, mimetype="text/plain", headers=headers
+                    )
                 else:
                     return Response(
                         "# Installation script not found\n# Please visit https://github.com/{GITHUB_REPO}\n",
@@ -263,11 +390,11 @@ def install_script():
 def api_releases():
     """API endpoint to get release information."""
     try:
-        response = requests.get(f"{GITHUB_API_BASE}/releases", timeout=10)
-        if response.status_code == 200:
-            return jsonify(response.json())
+        status, body, etag = _cached_get(f"{GITHUB_API_BASE}/releases")
+        if status == 200:
+            return _json_passthrough(body, etag)
         else:
-            return jsonify({"error": "Failed to fetch releases"}), response.status_code
+            return jsonify({"error": "Failed to fetch releases"}), status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -276,14 +403,11 @@ def api_releases():
 def api_latest():
     """API endpoint to get latest release information."""
     try:
-        response = requests.get(f"{GITHUB_API_BASE}/releases/latest", timeout=10)
-        if response.status_code == 200:
-            return jsonify(response.json())
+        status, body, etag = _cached_get(f"{GITHUB_API_BASE}/releases/latest")
+        if status == 200:
+            return _json_passthrough(body, etag)
         else:
-            return (
-                jsonify({"error": "Failed to fetch latest release"}),
-                response.status_code,
-            )
+            return jsonify({"error": "Failed to fetch latest release"}), status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -300,6 +424,31 @@ def health():
     )
 
 
+# Thread workers keep many GitHub downloads in flight per process
+GUNICORN_OPTIONS = {
+    "worker_class": "gthread",
+    "workers": int(os.environ.get("WEB_CONCURRENCY", 2)),
+    "threads": 16,
+    "keepalive": 5,
+}
+
+
+def run_gunicorn(port):
+    """Serve the app under gunicorn with the production options"""
+    from gunicorn.app.base import BaseApplication
+
+    class DownloadService(BaseApplication):
+        def load_config(self):
+            for key, value in GUNICORN_OPTIONS.items():
+                self.cfg.set(key, value)
+            self.cfg.set("bind", f"0.0.0.0:{port}")
+
+        def load(self):
+            return app
+
+    DownloadService().run()
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     debug = os.environ.get("DEBUG", "false").lower() == "true"
@@ -308,4 +457,11 @@ if __name__ == "__main__":
     print(f"📦 GitHub Repository: {GITHUB_REPO}")
     print(f"🔗 Install URL: http://localhost:{port}")
 
-    app.run(host="0.0.0.0", port=port, debug=debug)
+    if debug:
+        app.run(host="0.0.0.0", port=port, debug=True)
+    else:
+        try:
+            run_gunicorn(port)
+        except ImportError:
+            # gunicorn is not installed, fall back to Flask's threaded server
+            app.run(host="0.0.0.0", port=port, threaded=True)